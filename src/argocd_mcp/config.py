@@ -87,6 +87,17 @@ class ServerSettings(BaseSettings):
         default="INFO", description="Logging level"
     )
 
+    # HTTP connection pool per ArgoCD instance
+    http_max_connections: int = Field(
+        default=100, ge=1, description="Maximum concurrent connections per ArgoCD instance"
+    )
+    http_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Idle connections kept open per ArgoCD instance"
+    )
+    http_keepalive_expiry: float = Field(
+        default=60.0, ge=0, description="Seconds an idle pooled connection is kept open"
+    )
+
     # Nested security settings
     security: SecuritySettings = Field(default_factory=SecuritySettings)
 
@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+import httpx
 import structlog
 from mcp.server.fastmcp import Context, FastMCP
 
@@ -158,20 +160,35 @@ async def lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
         audit_logger=AuditLogger(settings.security.audit_log),
     )
 
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
     for instance in settings.all_instances:
-        client = ArgocdClient(instance=instance, mask_secrets=settings.security.mask_secrets)
+        client = ArgocdClient(
+            instance=instance, mask_secrets=settings.security.mask_secrets, limits=limits
+        )
         await client.__aenter__()
         ctx.clients[instance.name] = client
         logger.info("Connected to ArgoCD instance", instance=instance.name, url=instance.url)
 
+    # Connection setup overlaps with the MCP handshake instead of landing on
+    # the first tool call.
+    warmups = [asyncio.create_task(client.warmup()) for client in ctx.clients.values()]
+
     _context = ctx
     yield {"settings": ctx.settings, "clients": ctx.clients}
 
+    for task in warmups:
+        task.cancel()
+    await asyncio.gather(*warmups, return_exceptions=True)
     for name, client in ctx.clients.items():
         await client.__aexit__(None, None, None)
         logger.info("Disconnected from ArgoCD instance", instance=name)
 
     ctx.clients.clear()
+    ctx.audit_logger.close()
     _context = None
     logger.info("ArgoCD MCP Server stopped")
 
@@ -0,0 +1,15 @@
+# ABOUTME: Response text fragments shared by write and destructive tool handlers
+# ABOUTME: Keeps the fixed trailers and prefixes of tool responses in one place
+
+"""Shared response text for write and destructive tool handlers."""
+
+from __future__ import annotations
+
+from typing import Final
+
+# Fixed trailer shared by every "operation initiated" response.
+MONITOR_HINT: Final = "Use get_application_status to monitor progress."
+
+# Dry-run prefix for progress messages, indexed by the dry_run flag instead of
+# branching per call.
+MODE_PREFIX: Final = {True: "[DRY-RUN] ", False: ""}
@@ -0,0 +1,43 @@
+# ABOUTME: Non-blocking progress notifications for write and destructive tool handlers
+# ABOUTME: Sends the opening "initiating ..." progress without waiting on the MCP client
+
+"""Fire-and-forget progress reporting.
+
+The opening progress notification of a write tool is cosmetic: awaiting it
+serializes a round-trip to the MCP client before the ArgoCD request even
+starts. `report_progress_nowait` schedules the notification as a task so it
+overlaps with the API call. Terminal progress updates are still awaited by the
+handlers so completion ordering is unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import Context
+
+logger = structlog.get_logger(__name__)
+
+# The event loop only keeps weak references to tasks; hold them here until
+# they finish so an in-flight notification is not garbage collected.
+_pending: set[asyncio.Task[None]] = set()
+
+
+def _on_done(task: asyncio.Task[None]) -> None:
+    """Drop the finished task and surface a failed notification at debug level."""
+    _pending.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.debug("Progress notification failed", error=str(exc))
+
+
+def report_progress_nowait(
+    ctx: Context[Any, Any], progress: float, total: float, message: str
+) -> None:
+    """Schedule ctx.report_progress without awaiting its delivery."""
+    task = asyncio.create_task(ctx.report_progress(progress, total, message))
+    _pending.add(task)
+    task.add_done_callback(_on_done)
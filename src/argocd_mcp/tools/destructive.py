@@ -10,10 +10,13 @@ confirm_name matching the target name exactly.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import Context
 
+from argocd_mcp.tools._messages import MODE_PREFIX, MONITOR_HINT
+from argocd_mcp.tools._progress import report_progress_nowait
 from argocd_mcp.tools._safety import check_destination_cluster_allowed
 from argocd_mcp.tools.params import (
     DeleteApplicationParams,
@@ -43,6 +46,7 @@ if TYPE_CHECKING:
     GetAuditLogger = Callable[[], AuditLogger]
 
 
+@cache
 def _deps() -> tuple[GetClient, GetSafetyGuard, GetAuditLogger]:
     """Lazy resolve server-level accessors to avoid a circular import."""
     from argocd_mcp.server import (  # noqa: PLC0415
@@ -63,7 +67,7 @@ async def delete_application(params: DeleteApplicationParams, ctx: MCPContext) -
     also deletes Kubernetes resources managed by this application.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_destructive_operation(
         "delete_application",
@@ -105,7 +109,7 @@ async def delete_application(params: DeleteApplicationParams, ctx: MCPContext) -
         return cluster_block
 
     try:
-        await ctx.report_progress(0, 1, f"Deleting application {params.name}")
+        report_progress_nowait(ctx, 0, 1, f"Deleting application {params.name}")
 
         await client.delete_application(params.name, params.cascade)
 
@@ -135,7 +139,7 @@ async def sync_application_with_prune(
     Requires MCP_READ_ONLY=false and MCP_DISABLE_DESTRUCTIVE=false.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     if params.dry_run:
         blocked = get_safety_guard().check_write_operation("sync_application_with_prune")
@@ -173,8 +177,8 @@ async def sync_application_with_prune(
         return cluster_block
 
     try:
-        mode = "[DRY-RUN] " if params.dry_run else ""
-        await ctx.report_progress(0, 2, f"{mode}Initiating sync-with-prune for {params.name}")
+        mode = MODE_PREFIX[params.dry_run]
+        report_progress_nowait(ctx, 0, 2, f"{mode}Initiating sync-with-prune for {params.name}")
 
         await client.sync_application(
             name=params.name,
@@ -204,8 +208,7 @@ async def sync_application_with_prune(
         return (
             f"Sync-with-prune initiated for '{params.name}'\n"
             f"Revision: {params.revision or 'HEAD'}\n"
-            f"Prune: true\n\n"
-            f"Use get_application_status to monitor progress."
+            f"Prune: true\n\n{MONITOR_HINT}"
         )
 
     except ArgocdError as e:
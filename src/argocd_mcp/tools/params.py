@@ -93,6 +93,10 @@ class ListProjectsParams(BaseModel):
 # =============================================================================
 # Tier 2: Write parameter models
 # =============================================================================
+#
+# Write and destructive parameters are frozen: handlers read them once and
+# pass them straight through to the client, and nothing downstream should be
+# able to flip dry_run/confirm on an already-validated request.
 
 
 class SyncApplicationParams(BaseModel):
@@ -100,7 +104,7 @@ class SyncApplicationParams(BaseModel):
 
     # Reject unknown fields so agents get a clear error if they pass legacy `prune`
     # or mistype a field name, rather than having the typo silently dropped.
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     name: str = Field(description="Application name")
     dry_run: bool = Field(
@@ -114,6 +118,8 @@ class SyncApplicationParams(BaseModel):
 class RefreshApplicationParams(BaseModel):
     """Parameters for refresh_application tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Application name")
     hard: bool = Field(default=False, description="Force hard refresh (invalidate cache)")
     instance: str = Field(default="primary", description="ArgoCD instance name")
@@ -122,6 +128,8 @@ class RefreshApplicationParams(BaseModel):
 class RollbackApplicationParams(BaseModel):
     """Parameters for rollback_application tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Application name")
     revision_id: int = Field(description="History revision ID to rollback to")
     dry_run: bool = Field(
@@ -133,6 +141,8 @@ class RollbackApplicationParams(BaseModel):
 class TerminateSyncParams(BaseModel):
     """Parameters for terminate_sync tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Application name")
     instance: str = Field(default="primary", description="ArgoCD instance name")
 
@@ -145,6 +155,8 @@ class TerminateSyncParams(BaseModel):
 class DeleteApplicationParams(BaseModel):
     """Parameters for delete_application tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Application name to delete")
     cascade: bool = Field(
         default=True, description="Delete application resources from cluster (default: true)"
@@ -159,6 +171,8 @@ class DeleteApplicationParams(BaseModel):
 class SyncApplicationWithPruneParams(BaseModel):
     """Parameters for sync_application_with_prune tool (Tier 3 — destructive)."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Application name")
     dry_run: bool = Field(
         default=True, description="Preview deletions without applying (default: true)"
@@ -9,6 +9,8 @@ they never mutate cluster state. They are rate-limited only.
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp import Context
@@ -47,6 +49,7 @@ if TYPE_CHECKING:
     GetAuditLogger = Callable[[], AuditLogger]
 
 
+@cache
 def _deps() -> tuple[GetClient, GetSafetyGuard, GetAuditLogger]:
     """Lazy resolve server-level accessors to avoid a circular import."""
     # Intentional local import: server.py imports this module during its own load,
@@ -69,7 +72,7 @@ async def list_applications(params: ListApplicationsParams, ctx: MCPContext) ->
     an overview of applications in a project or find unhealthy/out-of-sync apps.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("list_applications")
     if blocked:
@@ -116,7 +119,7 @@ async def get_application(params: GetApplicationParams, ctx: MCPContext) -> str:
     health status, deployment destination, and any conditions or errors.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("get_application")
     if blocked:
@@ -178,7 +181,7 @@ async def get_application_status(params: GetApplicationStatusParams, ctx: MCPCon
     Use this for a quick status check when you don't need full application details.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("get_application_status")
     if blocked:
@@ -213,7 +216,7 @@ async def get_application_diff(params: GetApplicationDiffParams, ctx: MCPContext
     were triggered. Use this before syncing to understand the impact.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("get_application_diff")
     if blocked:
@@ -294,7 +297,7 @@ async def get_application_history(params: GetApplicationHistoryParams, ctx: MCPC
     Useful for understanding recent changes and finding rollback targets.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("get_application_history")
     if blocked:
@@ -332,7 +335,7 @@ async def diagnose_sync_failure(params: DiagnoseSyncFailureParams, ctx: MCPConte
     to identify root cause. Provides actionable suggestions for resolution.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("diagnose_sync_failure")
     if blocked:
@@ -342,16 +345,21 @@ async def diagnose_sync_failure(params: DiagnoseSyncFailureParams, ctx: MCPConte
     try:
         client = get_client(params.instance)
 
-        await ctx.report_progress(0, 4, "Fetching application status")
-        app = await client.get_application(params.name)
-
-        await ctx.report_progress(1, 4, "Gathering resource conditions")
-        tree_data = await client.get_resource_tree(params.name)
-
-        await ctx.report_progress(2, 4, "Collecting events")
-        events = await client.get_application_events(params.name)
-
-        await ctx.report_progress(3, 4, "Analyzing diagnosis")
+        # The three lookups are independent; issue them concurrently so the
+        # diagnosis waits for the slowest one rather than the sum of all three.
+        # As in the client's bulk fetches, the first failure cancels the other
+        # lookups and is re-raised on its own rather than as an ExceptionGroup.
+        await ctx.report_progress(0, 2, "Fetching application status, resources, and events")
+        try:
+            async with asyncio.TaskGroup() as group:
+                app_task = group.create_task(client.get_application(params.name))
+                tree_task = group.create_task(client.get_resource_tree(params.name))
+                events_task = group.create_task(client.get_application_events(params.name))
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        app, tree_data, events = app_task.result(), tree_task.result(), events_task.result()
+
+        await ctx.report_progress(1, 2, "Analyzing diagnosis")
 
         get_audit_logger().log_read("diagnose_sync_failure", params.name)
 
@@ -425,7 +433,7 @@ async def diagnose_sync_failure(params: DiagnoseSyncFailureParams, ctx: MCPConte
                     f"{r.get('health', {}).get('message', 'N/A')}"
                 )
 
-        await ctx.report_progress(4, 4, "Diagnosis complete")
+        await ctx.report_progress(2, 2, "Diagnosis complete")
 
         lines = [f"Diagnosis for '{params.name}':", ""]
 
@@ -458,7 +466,7 @@ async def get_application_logs(params: GetApplicationLogsParams, ctx: MCPContext
     monitoring runtime behavior.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("get_application_logs")
     if blocked:
@@ -506,7 +514,7 @@ async def list_clusters(params: ListClustersParams, ctx: MCPContext) -> str:
     Shows all clusters registered with ArgoCD and their connection status.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("list_clusters")
     if blocked:
@@ -543,7 +551,7 @@ async def list_projects(params: ListProjectsParams, ctx: MCPContext) -> str:
     Shows all projects which organize and control application access.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_read_operation("list_projects")
     if blocked:
@@ -9,10 +9,13 @@ gated by the read-only switch and default to dry-run mode where applicable.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, Final
 
 from mcp.server.fastmcp import Context
 
+from argocd_mcp.tools._messages import MODE_PREFIX, MONITOR_HINT
+from argocd_mcp.tools._progress import report_progress_nowait
 from argocd_mcp.tools._safety import check_destination_cluster_allowed
 from argocd_mcp.tools.params import (
     RefreshApplicationParams,
@@ -29,6 +32,11 @@ from argocd_mcp.utils.logging import set_correlation_id
 # InvalidSignature. server.py applies the same pattern.
 MCPContext = Context[Any, Any]
 
+# Flag renderings indexed by the boolean parameter instead of branching per call.
+_REFRESH_TYPE: Final = {True: "hard", False: "normal"}
+# Audit details are only serialized, never mutated, so both variants are shared.
+_HARD_DETAILS: Final = {True: {"hard": True}, False: {"hard": False}}
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -43,6 +51,7 @@ if TYPE_CHECKING:
     GetAuditLogger = Callable[[], AuditLogger]
 
 
+@cache
 def _deps() -> tuple[GetClient, GetSafetyGuard, GetAuditLogger]:
     """Lazy resolve server-level accessors to avoid a circular import."""
     from argocd_mcp.server import (  # noqa: PLC0415
@@ -65,7 +74,7 @@ async def sync_application(params: SyncApplicationParams, ctx: MCPContext) -> st
     explicit confirmation.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_write_operation("sync_application")
     if blocked:
@@ -84,8 +93,8 @@ async def sync_application(params: SyncApplicationParams, ctx: MCPContext) -> st
         return cluster_block
 
     try:
-        mode = "[DRY-RUN] " if params.dry_run else ""
-        await ctx.report_progress(0, 2, f"{mode}Initiating sync for {params.name}")
+        mode = MODE_PREFIX[params.dry_run]
+        report_progress_nowait(ctx, 0, 2, f"{mode}Initiating sync for {params.name}")
 
         await client.sync_application(
             name=params.name,
@@ -112,8 +121,7 @@ async def sync_application(params: SyncApplicationParams, ctx: MCPContext) -> st
         )
         return (
             f"Sync initiated for '{params.name}'\n"
-            f"Revision: {params.revision or 'HEAD'}\n\n"
-            f"Use get_application_status to monitor progress."
+            f"Revision: {params.revision or 'HEAD'}\n\n{MONITOR_HINT}"
         )
 
     except ArgocdError as e:
@@ -129,7 +137,7 @@ async def refresh_application(params: RefreshApplicationParams, ctx: MCPContext)
     Use hard=true to invalidate cache and force full refresh.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_write_operation("refresh_application")
     if blocked:
@@ -148,13 +156,13 @@ async def refresh_application(params: RefreshApplicationParams, ctx: MCPContext)
         return cluster_block
 
     try:
-        refresh_type = "hard" if params.hard else "normal"
-        await ctx.report_progress(0, 1, f"Triggering {refresh_type} refresh")
+        refresh_type = _REFRESH_TYPE[params.hard]
+        report_progress_nowait(ctx, 0, 1, f"Triggering {refresh_type} refresh")
 
         app = await client.refresh_application(params.name, params.hard)
 
         get_audit_logger().log_write(
-            "refresh_application", params.name, "success", {"hard": params.hard}
+            "refresh_application", params.name, "success", _HARD_DETAILS[params.hard]
         )
 
         return (
@@ -175,7 +183,7 @@ async def rollback_application(params: RollbackApplicationParams, ctx: MCPContex
     to a known-good state. Defaults to dry-run mode for safety.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_write_operation("rollback_application")
     if blocked:
@@ -194,8 +202,8 @@ async def rollback_application(params: RollbackApplicationParams, ctx: MCPContex
         return cluster_block
 
     try:
-        mode = "[DRY-RUN] " if params.dry_run else ""
-        await ctx.report_progress(0, 1, f"{mode}Rolling back {params.name}")
+        mode = MODE_PREFIX[params.dry_run]
+        report_progress_nowait(ctx, 0, 1, f"{mode}Rolling back {params.name}")
 
         await client.rollback_application(
             name=params.name, revision_id=params.revision_id, dry_run=params.dry_run
@@ -218,7 +226,7 @@ async def rollback_application(params: RollbackApplicationParams, ctx: MCPContex
         )
         return (
             f"Rollback initiated for '{params.name}' to revision {params.revision_id}\n\n"
-            f"Use get_application_status to monitor progress."
+            + MONITOR_HINT
         )
 
     except ArgocdError as e:
@@ -234,7 +242,7 @@ async def terminate_sync(params: TerminateSyncParams, ctx: MCPContext) -> str:
     is stuck, taking too long, or was triggered by mistake.
     """
     get_client, get_safety_guard, get_audit_logger = _deps()
-    set_correlation_id(ctx.request_id if hasattr(ctx, "request_id") else "")
+    set_correlation_id(getattr(ctx, "request_id", ""))
 
     blocked = get_safety_guard().check_write_operation("terminate_sync")
     if blocked:
@@ -253,7 +261,7 @@ async def terminate_sync(params: TerminateSyncParams, ctx: MCPContext) -> str:
         return cluster_block
 
     try:
-        await ctx.report_progress(0, 1, f"Terminating sync for {params.name}")
+        report_progress_nowait(ctx, 0, 1, f"Terminating sync for {params.name}")
 
         await client.terminate_sync(params.name)
 
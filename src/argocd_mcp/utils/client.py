@@ -5,27 +5,68 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import json
+import random
 import re
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+import time
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NoReturn, TypeVar
+from urllib.parse import quote
 
 import httpx
 import structlog
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+
     from argocd_mcp.config import ArgocdInstance
 
+# orjson is an optional accelerator for large response bodies (resource trees,
+# managed resources). Both parsers accept bytes and return plain dict/list
+# values, so the rest of the client is unaware of which one is in use.
+# Resolved via import_module so type checking is identical with or without it.
+_json_loads: Callable[[bytes | str], Any]
+try:
+    _json_loads = importlib.import_module("orjson").loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = structlog.get_logger(__name__)
 
-# Regex patterns to mask sensitive data in strings
-SECRET_PATTERNS = [
-    (re.compile(r"(token[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", re.I), r"\1***MASKED***"),
-    (re.compile(r"(password[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", re.I), r"\1***MASKED***"),
-    (re.compile(r"(secret[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", re.I), r"\1***MASKED***"),
-    (re.compile(r"(api[_-]?key[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", re.I), r"\1***MASKED***"),
-    (re.compile(r"(bearer\s+)[^\s\"']+", re.I), r"\1***MASKED***"),
-]
+# Shared by SECRET_PATTERNS and _SECRET_HINT so the pre-filter accepts every
+# string the patterns can match. re.ASCII is deliberately not set: it would
+# narrow \s to ASCII whitespace and leave e.g. "Bearer\xa0<token>" unmasked.
+_SECRET_FLAGS = re.IGNORECASE
+
+# Regexes masking sensitive data in strings, applied in order. They must stay
+# separate sequential passes: each pass rescans the output of the previous one,
+# so a keyword swallowed as another pattern's value (e.g. "bearer token: <jwt>"
+# or "api_key=xpassword: y") still gets its own secret masked. A single
+# leftmost-match alternation would leave those secrets in plain text.
+SECRET_PATTERNS = (
+    (re.compile(r"(token[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", _SECRET_FLAGS), r"\1***MASKED***"),
+    (re.compile(r"(password[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", _SECRET_FLAGS), r"\1***MASKED***"),
+    (re.compile(r"(secret[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", _SECRET_FLAGS), r"\1***MASKED***"),
+    (
+        re.compile(r"(api[_-]?key[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+", _SECRET_FLAGS),
+        r"\1***MASKED***",
+    ),
+    (re.compile(r"(bearer\s+)[^\s\"']+", _SECRET_FLAGS), r"\1***MASKED***"),
+)
+
+# Cheap pre-filter for the string branch of _mask_response. Every pattern in
+# SECRET_PATTERNS starts at one of these keywords, so a string that contains
+# none of them cannot match and the substitution is skipped entirely.
+# Most ArgoCD response strings (names, URLs, statuses) take this fast path.
+_SECRET_HINT = re.compile(r"token|password|secret|api[_-]?key|bearer", _SECRET_FLAGS)
+
+# Shortest string SECRET_PATTERNS can match ("token=x"); anything shorter, such
+# as the many short status/kind/name values in a response, skips the regex.
+_MIN_SECRET_LEN = 7
 
 # Substrings that trigger masking when found in a dictionary key (case-insensitive).
 # Using substring matching catches camelCase (clientSecret), snake_case (api_key),
@@ -45,12 +86,70 @@ SENSITIVE_SUBSTRINGS: tuple[str, ...] = (
 )
 
 
+# ArgoCD responses reuse a small vocabulary of field names across thousands of
+# nested objects, so the verdict is memoized instead of lowercasing every key.
+@lru_cache(maxsize=1024)
 def _is_sensitive_key(key: str) -> bool:
     """Return True if the key name indicates a sensitive value."""
-    lowered = key.lower()
+    # Most keys seen on a cache miss are already lowercase; skip the copy.
+    lowered = key if key.islower() else key.lower()
     return any(substr in lowered for substr in SENSITIVE_SUBSTRINGS)
 
 
+# Shared read-only stand-in for absent nested sections in API responses.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+# Short strings (names, namespaces, label values, statuses) repeat heavily
+# within and across responses, so their masked form is memoized. Long strings
+# such as log lines and manifests are rarely repeated and bypass the cache.
+_MASK_CACHE_MAX_LEN = 512
+
+
+def _mask_string(value: str) -> str:
+    """Apply SECRET_PATTERNS to a string, skipping the regex pass when no keyword is present."""
+    if len(value) < _MIN_SECRET_LEN:
+        return value
+    if len(value) <= _MASK_CACHE_MAX_LEN:
+        return _mask_short_string(value)
+    return _scan_string(value)
+
+
+@lru_cache(maxsize=4096)
+def _mask_short_string(value: str) -> str:
+    """Memoized _scan_string for strings up to _MASK_CACHE_MAX_LEN characters."""
+    return _scan_string(value)
+
+
+def _scan_string(value: str) -> str:
+    """Substitute every SECRET_PATTERNS match in value."""
+    hint = _SECRET_HINT.search(value)
+    if hint is None:
+        return value
+    # Nothing can match before the first keyword, so only the tail from that
+    # offset is rescanned. Keeps long log/message strings with a late secret cheap.
+    start = hint.start()
+    tail = value[start:]
+    for pattern, replacement in SECRET_PATTERNS:
+        tail = pattern.sub(replacement, tail)
+    return value[:start] + tail if start else tail
+
+
+# Characters quote() never escapes. Kubernetes resource names (DNS-1123) are
+# always made of these, so the usual name is used verbatim without a quote().
+_UNRESERVED_NAME = re.compile(r"[A-Za-z0-9_.~-]+")
+
+
+def _app_path(name: str, suffix: str = "") -> str:
+    """Build an /applications/{name} API path with the name percent-encoded.
+
+    Encoding with safe="" keeps a name containing "/", "?" or "#" inside its
+    own path segment instead of addressing a different endpoint.
+    """
+    segment = name if _UNRESERVED_NAME.fullmatch(name) else quote(name, safe="")
+    return f"/applications/{segment}{suffix}"
+
+
 class ArgocdError(Exception):
     """Structured ArgoCD API error."""
 
@@ -58,7 +157,9 @@ class ArgocdError(Exception):
         self.code = code
         self.message = message
         self.details = details
-        super().__init__(str(self))
+        # The full text is rendered lazily by __str__; errors that are caught
+        # and inspected by code never pay for the formatting.
+        super().__init__(message)
 
     def __str__(self) -> str:
         base = f"ArgoCD API error ({self.code}): {self.message}"
@@ -96,11 +197,13 @@ class Application:
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> Application:
         """Create Application from ArgoCD API response."""
-        metadata = data.get("metadata", {})
-        spec = data.get("spec", {})
-        status = data.get("status", {})
-        source = spec.get("source", {})
-        destination = spec.get("destination", {})
+        # `or _EMPTY` instead of `.get(key, {})` avoids allocating a throwaway
+        # dict for every missing section; list responses parse hundreds of apps.
+        metadata = data.get("metadata") or _EMPTY
+        spec = data.get("spec") or _EMPTY
+        status = data.get("status") or _EMPTY
+        source = spec.get("source") or _EMPTY
+        destination = spec.get("destination") or _EMPTY
 
         return cls(
             name=metadata.get("name", ""),
@@ -111,14 +214,130 @@ class Application:
             target_revision=source.get("targetRevision", "HEAD"),
             destination_server=destination.get("server", ""),
             destination_namespace=destination.get("namespace", ""),
-            sync_status=status.get("sync", {}).get("status", "Unknown"),
-            health_status=status.get("health", {}).get("status", "Unknown"),
+            sync_status=(status.get("sync") or _EMPTY).get("status", "Unknown"),
+            health_status=(status.get("health") or _EMPTY).get("status", "Unknown"),
             operation_state=status.get("operationState"),
             conditions=status.get("conditions"),
             resources=status.get("resources"),
         )
 
 
+_T = TypeVar("_T")
+
+
+async def _gather_bounded(
+    names: Sequence[str], fetch: Callable[[str], Awaitable[_T]], concurrency: int
+) -> list[_T]:
+    """Run `fetch` for every name with at most `concurrency` calls in flight.
+
+    The first failure cancels every fetch still queued or in flight, so a
+    failing fan-out stops hitting ArgoCD, and is re-raised on its own rather
+    than wrapped in the TaskGroup's ExceptionGroup.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(name: str) -> _T:
+        async with semaphore:
+            return await fetch(name)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(bounded(name)) for name in names]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
+# Application fields that can carry free-form text from Git or the cluster and
+# are therefore masked. The rest are Kubernetes names or status enums.
+_APP_MASKED_FIELDS = (
+    "repo_url",
+    "path",
+    "target_revision",
+    "destination_server",
+    "operation_state",
+    "conditions",
+    "resources",
+)
+
+
+# Retry policy for transient transport failures in ArgocdClient._request.
+# Backoff doubles from RETRY_BASE_DELAY up to RETRY_MAX_DELAY, scaled by a
+# random factor in [0.5, 1.0) so concurrent callers do not retry in lockstep.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+
+# Responses that mean "try again later". 429 is retried for every method since
+# the server rejected the request outright; gateway errors only for GET, as a
+# write may already have been applied behind the gateway.
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Transport failures raised before any of the request reached the server. Only
+# these are retried for writes; a read/write timeout or a dropped connection
+# may follow a sync, rollback or delete that ArgoCD has already applied.
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the jittered backoff in seconds before retry number `attempt` (1-based)."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2.0 ** (attempt - 1))
+    return delay * (0.5 + random.random() / 2)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Return a Retry-After header given in seconds, capped at RETRY_MAX_DELAY."""
+    value = response.headers.get("Retry-After", "")
+    if not value.isdigit():
+        return None
+    return min(float(value), RETRY_MAX_DELAY)
+
+
+# The server lifespan keeps one ArgocdClient, and therefore one connection
+# pool, per instance for the life of the process. Agent tool calls usually
+# arrive several seconds apart, so httpx's default 5s keepalive_expiry would
+# drop the pooled TLS connection between most calls and pay a fresh handshake.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
+# Short-lived cache for single-application GETs. Write and destructive tools
+# look the application up for the destination-cluster check and again for
+# confirmation details, and agents tend to re-issue a confirmation flow within
+# seconds; a few seconds of reuse removes those duplicate round-trips while
+# staying well inside ArgoCD's own reconciliation interval. Any mutation of
+# an application through this client evicts its entry.
+APPLICATION_CACHE_TTL = 5.0
+APPLICATION_CACHE_SIZE = 256
+
+# Maximum number of (path, params) entries remembered for conditional GETs.
+# Responses are only stored when ArgoCD sends an ETag, and the server decides
+# freshness on every request, so entries never need explicit invalidation.
+ETAG_CACHE_SIZE = 128
+
+# Response bodies at least this large are masked in a worker thread so a big
+# resource tree does not stall other tool calls on the event loop.
+MASK_OFFLOAD_BYTES = 64 * 1024
+
+# Default number of concurrent GETs issued by get_applications_bulk.
+BULK_CONCURRENCY = 16
+
+# Query strings for boolean flags, indexed by the flag. Shared and read-only:
+# nothing downstream of _send mutates request params.
+_REFRESH_PARAMS: dict[bool, dict[str, Any]] = {
+    True: {"refresh": "hard"},
+    False: {"refresh": "normal"},
+}
+_CASCADE_PARAMS: dict[bool, dict[str, Any]] = {
+    True: {"cascade": "true"},
+    False: {"cascade": "false"},
+}
+
+
 class ArgocdClient:
     """Async ArgoCD API client with retry logic. Use as async context manager."""
 
@@ -127,14 +346,24 @@ class ArgocdClient:
         instance: ArgocdInstance,
         timeout: float = 30.0,
         mask_secrets: bool = True,
+        limits: httpx.Limits = DEFAULT_POOL_LIMITS,
     ) -> None:
         self._instance = instance
         self._timeout = timeout
         self._mask_secrets = mask_secrets
+        self._limits = limits
         self._client: httpx.AsyncClient | None = None
+        # Number of open `async with` scopes sharing self._client. The lifespan
+        # holds one for the process lifetime; nested scopes reuse its pool.
+        self._entered = 0
+        self._app_cache: dict[str, tuple[float, Application]] = {}
+        self._etag_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[str, Any, int]] = {}
 
     async def __aenter__(self) -> ArgocdClient:
-        """Enter async context and create HTTP client."""
+        """Enter async context, creating the HTTP client on the first entry only."""
+        self._entered += 1
+        if self._client is not None:
+            return self
         self._client = httpx.AsyncClient(
             base_url=f"{self._instance.url}/api/v1",
             headers={
@@ -143,57 +372,72 @@ class ArgocdClient:
             },
             timeout=self._timeout,
             verify=not self._instance.insecure,
+            limits=self._limits,
         )
         return self
 
     async def __aexit__(self, *args: object) -> None:
-        """Exit async context and close HTTP client."""
+        """Exit async context, closing the HTTP client when the last scope exits."""
+        self._entered = max(0, self._entered - 1)
+        if self._entered:
+            return
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._app_cache.clear()
+        self._etag_cache.clear()
 
-    # Maximum recursion depth for _mask_response. ArgoCD resource trees and
-    # manifests are deeply nested but never legitimately reach this depth;
-    # exceeding it almost certainly indicates a cycle or pathological input.
-    # The cap protects the event loop from a stack overflow in CPython.
-    _MAX_MASK_DEPTH: int = 64
+    async def warmup(self) -> None:
+        """Open a pooled connection ahead of the first real request.
 
-    def _mask_response(self, data: Any, _depth: int = 0) -> Any:
-        """Recursively mask sensitive values in response data."""
+        Sends HEAD /settings and ignores the outcome: the point is only to get
+        DNS, TCP and TLS setup done so the first tool call reuses a warm
+        connection. Failures are logged at debug level and never raised.
+        """
+        if not self._client:
+            return
+        try:
+            await self._client.head("/settings")
+        except httpx.HTTPError as e:
+            logger.debug("ArgoCD warmup request failed", instance=self._instance.name, error=str(e))
+
+    def _mask_response(self, data: Any) -> Any:
+        """Mask sensitive values in response data.
+
+        Walks the structure with an explicit stack instead of recursing, so
+        deeply nested resource trees cost no Python frames per node and are
+        masked all the way down. Containers are copied; the input is never
+        mutated. Parsed JSON is acyclic, so the walk always terminates.
+        """
         if not self._mask_secrets:
             return data
 
-        if _depth >= self._MAX_MASK_DEPTH:
-            # Return the value as-is at the depth limit. We've already masked
-            # everything shallower than this; anything below is best-effort.
-            logger.warning("mask_response depth limit reached", depth=_depth)
-            return data
+        pending: list[tuple[Any, Any]] = []
+
+        def mask(value: Any) -> Any:
+            if isinstance(value, str):
+                return _mask_string(value)
+            copy: dict[str, Any] | list[Any]
+            if isinstance(value, dict):
+                copy = {}
+            elif isinstance(value, list):
+                copy = [None] * len(value)
+            else:
+                return value
+            pending.append((value, copy))
+            return copy
+
+        result = mask(data)
+        while pending:
+            source, target = pending.pop()
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    target[key] = "***MASKED***" if _is_sensitive_key(key) else mask(value)
+            else:
+                for index, value in enumerate(source):
+                    target[index] = mask(value)
+        return result
 
-        if isinstance(data, str):
-            masked_str = data
-            for pattern, replacement in SECRET_PATTERNS:
-                masked_str = pattern.sub(replacement, masked_str)
-            return masked_str
-
-        if isinstance(data, dict):
-            masked_dict: dict[str, Any] = {}
-            for k, v in data.items():
-                if _is_sensitive_key(k):
-                    masked_dict[k] = "***MASKED***"
-                else:
-                    masked_dict[k] = self._mask_response(v, _depth + 1)
-            return masked_dict
-
-        if isinstance(data, list):
-            return [self._mask_response(item, _depth + 1) for item in data]
-
-        return data
-
-    @retry(
-        retry=retry_if_exception_type(httpx.TimeoutException),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
     async def _request(
         self,
         method: str,
@@ -201,33 +445,227 @@ class ArgocdClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make HTTP request to ArgoCD API with retry logic."""
+        """Make HTTP request to ArgoCD API and return the masked JSON object body."""
+        result, size = await self._send(method, path, params=params, json_data=json_data)
+        masked = await self._mask_sized(result, size)
+        return masked if isinstance(masked, dict) else {}
+
+    async def _request_items(self, path: str, params: dict[str, Any] | None = None) -> list[Any]:
+        """GET a list endpoint and return its masked `items`.
+
+        Each item is masked on its own and the list envelope is never copied,
+        so callers building objects from the items walk the payload once
+        instead of masking the whole response first and iterating it again.
+        """
+        items, size = await self._raw_items(path, params=params)
+        masked: list[Any] = await self._mask_sized(items, size)
+        return masked
+
+    async def _raw_items(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> tuple[list[Any], int]:
+        """GET a list endpoint and return its unmasked `items` with the body size."""
+        data, size = await self._send("GET", path, params=params)
+        items = data.get("items") if isinstance(data, dict) else None
+        return (items, size) if isinstance(items, list) else ([], size)
+
+    def _parse_application(self, data: Any) -> Application:
+        """Build an Application from an unmasked API object, masking only what it keeps.
+
+        The API object also carries the full spec, history and status summary,
+        none of which survive into the dataclass; masking just the retained
+        free-form fields skips walking the rest.
+        """
+        app = Application.from_api_response(data if isinstance(data, dict) else {})
+        if not self._mask_secrets:
+            return app
+        mask = self._mask_response
+        return replace(app, **{field: mask(getattr(app, field)) for field in _APP_MASKED_FIELDS})
+
+    def _parse_applications(self, items: list[Any]) -> list[Application]:
+        """Build Applications from a list of unmasked API objects."""
+        return [self._parse_application(item) for item in items]
+
+    async def _mask_sized(self, data: Any, size: int) -> Any:
+        """Mask data parsed from a `size`-byte body, off the event loop when it is large.
+
+        Masking a multi-megabyte resource tree is seconds of pure Python; in a
+        worker thread the interpreter's switch interval still lets the event
+        loop serve other tool calls in the meantime.
+        """
+        if not self._mask_secrets or size < MASK_OFFLOAD_BYTES:
+            return self._mask_response(data)
+        return await asyncio.to_thread(self._mask_response, data)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json_data: dict[str, Any] | None = None,
+    ) -> tuple[Any, int]:
+        """Send a request, retrying timeouts with jittered backoff, and parse the JSON body.
+
+        Returns the parsed body together with its size in bytes.
+
+        The success path is a single awaited request; retry bookkeeping only
+        runs once a transient failure has actually happened. Timeouts and
+        connection failures are retried with jittered backoff, as are
+        RETRY_STATUS_CODES responses (honouring Retry-After). Writes are only
+        retried when the request was never sent (_UNSENT_ERRORS) or got a 429;
+        read/write timeouts and dropped connections are retried for GET only.
+        After RETRY_ATTEMPTS the last exception propagates, or the last
+        response is handled as an ordinary error.
+
+        GET responses carrying an ETag are remembered; the next GET of the same
+        path and params is sent with If-None-Match, and a 304 reuses the parsed
+        body without transferring or parsing it again.
+        """
         if not self._client:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
-        log = logger.bind(method=method, path=path, instance=self._instance.name)
-        log.debug("Making ArgoCD API request")
+        # Context is passed per call rather than through logger.bind(): bind
+        # allocates a new BoundLogger on every request, while the filtering
+        # logger drops a disabled debug call before touching its kwargs.
+        instance = self._instance.name
+        logger.debug("Making ArgoCD API request", method=method, path=path, instance=instance)
 
-        response = await self._client.request(method, path, params=params, json=json_data)
+        cache_key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(cache_key) if method == "GET" else None
+        headers = {"If-None-Match": cached[0]} if cached else None
 
-        if response.status_code >= 400:
-            error_body = response.text
-            log.warning("ArgoCD API error", status=response.status_code, body=error_body[:200])
-
-            message = f"HTTP {response.status_code}"
-            details = None
+        attempt = 1
+        while True:
             try:
-                error_json = response.json()
-                message = error_json.get("message", message)
-                details = error_json.get("error")
-            except Exception:
-                details = error_body[:200] if error_body else None
+                response = await self._client.request(
+                    method, path, params=params, json=json_data, headers=headers
+                )
+            except (
+                httpx.TimeoutException,
+                httpx.ConnectError,
+                httpx.RemoteProtocolError,
+            ) as exc:
+                if attempt >= RETRY_ATTEMPTS or (
+                    method != "GET" and not isinstance(exc, _UNSENT_ERRORS)
+                ):
+                    raise
+                delay = _retry_delay(attempt)
+                reason = type(exc).__name__
+            else:
+                status = response.status_code
+                if (
+                    status not in RETRY_STATUS_CODES
+                    or (method != "GET" and status != 429)
+                    or attempt >= RETRY_ATTEMPTS
+                ):
+                    break
+                retry_after = _retry_after(response)
+                delay = _retry_delay(attempt) if retry_after is None else retry_after
+                reason = f"HTTP {status}"
+            logger.warning(
+                "ArgoCD API request failed, retrying",
+                method=method,
+                path=path,
+                instance=instance,
+                attempt=attempt,
+                delay=delay,
+                reason=reason,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
-            raise ArgocdError(code=response.status_code, message=message, details=details)
+        if response.status_code >= 400:
+            self._raise_api_error(response, method, path)
+
+        if cached and response.status_code == 304:
+            return cached[1], cached[2]
+
+        size = len(response.content)
+        result = _json_loads(response.content) if size else {}
+        if method == "GET" and (etag := response.headers.get("ETag")):
+            self._etag_cache.pop(cache_key, None)
+            if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+                del self._etag_cache[next(iter(self._etag_cache))]
+            self._etag_cache[cache_key] = (etag, result, size)
+        return result, size
+
+    def _raise_api_error(self, response: httpx.Response, method: str, path: str) -> NoReturn:
+        """Log an error response and raise it as an ArgocdError."""
+        # Parse and truncate the raw bytes: error bodies can be large HTML
+        # pages from a proxy, and only the first 200 bytes are ever shown.
+        error_body = response.content
+        snippet = error_body[:200].decode(errors="replace")
+        logger.warning(
+            "ArgoCD API error",
+            method=method,
+            path=path,
+            instance=self._instance.name,
+            status=response.status_code,
+            body=snippet,
+        )
 
-        result = response.json() if response.content else {}
-        masked = self._mask_response(result)
-        return masked if isinstance(masked, dict) else {}
+        message = f"HTTP {response.status_code}"
+        details = None
+        try:
+            error_json = _json_loads(error_body)
+            message = error_json.get("message", message)
+            details = error_json.get("error")
+        except Exception:
+            details = snippet or None
+
+        raise ArgocdError(code=response.status_code, message=message, details=details)
+
+    async def _stream_lines(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[Any]:
+        """GET a newline-delimited JSON endpoint and yield each parsed line.
+
+        Lines are parsed as they arrive instead of after the whole body has
+        been buffered. Streams are not retried: a timeout part-way through
+        cannot be resumed without duplicating lines already yielded.
+
+        The gateway reports failures after the 200 header as an
+        {"error": {...}} line; that line, or one that is not valid JSON, is
+        raised as an ArgocdError (502 when the line carries no HTTP code).
+        """
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        logger.debug("Streaming ArgoCD API request", path=path, instance=self._instance.name)
+        async with self._client.stream("GET", path, params=params) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                self._raise_api_error(response, "GET", path)
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    item = _json_loads(line)
+                except ValueError:
+                    # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors.
+                    logger.warning(
+                        "Malformed ArgoCD stream line",
+                        path=path,
+                        instance=self._instance.name,
+                        line=line[:200],
+                    )
+                    raise ArgocdError(
+                        code=502, message="Malformed response from ArgoCD", details=line[:200]
+                    ) from None
+                if isinstance(item, dict) and "error" in item and "result" not in item:
+                    error = item["error"] if isinstance(item["error"], dict) else {}
+                    logger.warning(
+                        "ArgoCD stream error",
+                        path=path,
+                        instance=self._instance.name,
+                        error=item["error"],
+                    )
+                    raise ArgocdError(
+                        code=error.get("http_code") or 502,
+                        message=error.get("message") or "ArgoCD stream error",
+                        details=error.get("http_status"),
+                    )
+                yield item
 
     # Application Operations
 
@@ -235,33 +673,63 @@ class ArgocdClient:
         self, project: str | None = None, selector: str | None = None
     ) -> list[Application]:
         """List ArgoCD applications, optionally filtered by project or label selector."""
-        params: dict[str, str] = {}
-        if project:
-            params["project"] = project
-        if selector:
-            params["selector"] = selector
-
-        data = await self._request("GET", "/applications", params=params or None)
-        items = data.get("items") or []
-        return [Application.from_api_response(item) for item in items]
+        params = {k: v for k, v in (("project", project), ("selector", selector)) if v}
+        items, size = await self._raw_items("/applications", params=params or None)
+        if not self._mask_secrets or size < MASK_OFFLOAD_BYTES:
+            return self._parse_applications(items)
+        return await asyncio.to_thread(self._parse_applications, items)
 
     async def get_application(self, name: str) -> Application:
-        """Get application by name."""
-        data = await self._request("GET", f"/applications/{name}")
-        return Application.from_api_response(data)
+        """Get application by name, reusing a fetch from the last APPLICATION_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._app_cache.get(name)
+        if cached is not None and now - cached[0] < APPLICATION_CACHE_TTL:
+            return cached[1]
+
+        data, _ = await self._send("GET", _app_path(name))
+        app = self._parse_application(data)
+        self._cache_application(name, app, now)
+        return app
+
+    async def get_applications_bulk(
+        self, names: Sequence[str], concurrency: int = BULK_CONCURRENCY
+    ) -> list[Application]:
+        """Fetch several applications concurrently, returned in the order of `names`.
+
+        At most `concurrency` requests are in flight at once so a large fan-out
+        shares the connection pool instead of queueing on it. The first
+        ArgocdError raised by any fetch propagates and cancels the rest.
+        """
+        return await _gather_bounded(names, self.get_application, concurrency)
+
+    def _cache_application(self, name: str, app: Application, fetched_at: float) -> None:
+        """Store an application fetch, evicting the oldest entry when full."""
+        self._app_cache.pop(name, None)
+        if len(self._app_cache) >= APPLICATION_CACHE_SIZE:
+            del self._app_cache[next(iter(self._app_cache))]
+        self._app_cache[name] = (fetched_at, app)
 
     async def get_application_diff(self, name: str, revision: str | None = None) -> dict[str, Any]:
         """Get diff showing what would change on sync."""
         params = {"revision": revision} if revision else {}
         return await self._request(
-            "GET", f"/applications/{name}/managed-resources", params=params or None
+            "GET", _app_path(name, "/managed-resources"), params=params or None
         )
 
     async def get_application_history(self, name: str, limit: int = 10) -> list[dict[str, Any]]:
-        """Get application deployment history."""
-        app_data = await self._request("GET", f"/applications/{name}")
-        history = app_data.get("status", {}).get("history", [])
-        return history[-limit:] if history else []
+        """Get application deployment history.
+
+        Only the returned tail of status.history is masked; the rest of the
+        application (resources, operation state, conditions) is discarded
+        unmasked instead of being walked for secrets first.
+        """
+        data, _ = await self._send("GET", _app_path(name))
+        status = (data.get("status") if isinstance(data, dict) else None) or _EMPTY
+        history = status.get("history")
+        if not isinstance(history, list) or not history:
+            return []
+        tail: list[dict[str, Any]] = self._mask_response(history[-limit:])
+        return tail
 
     async def get_application_events(
         self,
@@ -270,19 +738,23 @@ class ArgocdClient:
         resource_kind: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get Kubernetes events for application resources."""
-        params: dict[str, str] = {}
-        if resource_name:
-            params["resourceName"] = resource_name
-        if resource_kind:
-            params["resourceKind"] = resource_kind
-
-        data = await self._request("GET", f"/applications/{name}/events", params=params or None)
-        items = data.get("items", [])
-        return list(items) if isinstance(items, list) else []
+        params = {
+            k: v for k, v in (("resourceName", resource_name), ("resourceKind", resource_kind)) if v
+        }
+        return await self._request_items(_app_path(name, "/events"), params=params or None)
 
     async def get_resource_tree(self, name: str) -> dict[str, Any]:
         """Get resource tree showing hierarchy of Kubernetes resources."""
-        return await self._request("GET", f"/applications/{name}/resource-tree")
+        return await self._request("GET", _app_path(name, "/resource-tree"))
+
+    async def get_resource_trees_bulk(
+        self, names: Sequence[str], concurrency: int = BULK_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """Fetch the resource trees of several applications concurrently, in `names` order.
+
+        Bounded and error-propagating like get_applications_bulk.
+        """
+        return await _gather_bounded(names, self.get_resource_tree, concurrency)
 
     async def get_logs(
         self,
@@ -294,16 +766,28 @@ class ArgocdClient:
     ) -> str:
         """Get pod logs for application."""
         params: dict[str, Any] = {"tailLines": tail_lines}
-        if pod_name:
-            params["podName"] = pod_name
-        if container:
-            params["container"] = container
-        if since_seconds:
-            params["sinceSeconds"] = since_seconds
-
-        data = await self._request("GET", f"/applications/{name}/logs", params=params)
-        content = data.get("content", "") if isinstance(data, dict) else str(data)
-        return str(content)
+        params.update(
+            (k, v)
+            for k, v in (
+                ("podName", pod_name),
+                ("container", container),
+                ("sinceSeconds", since_seconds),
+            )
+            if v
+        )
+        # ArgoCD streams one {"result": {"content": ...}} object per log line.
+        # The lines are joined first and masked once as a single string.
+        lines: list[str] = []
+        async for line in self._stream_lines(_app_path(name, "/logs"), params=params):
+            if not isinstance(line, dict):
+                continue
+            entry = line.get("result", line)
+            content = entry.get("content") if isinstance(entry, dict) else None
+            if content:
+                lines.append(str(content))
+        text = "\n".join(lines)
+        masked: str = await self._mask_sized(text, len(text))
+        return masked
 
     # Write Operations
 
@@ -321,43 +805,51 @@ class ArgocdClient:
             body["revision"] = revision
         if force:
             body["strategy"] = {"hook": {"force": True}}
-        return await self._request("POST", f"/applications/{name}/sync", json_data=body)
+        try:
+            return await self._request("POST", _app_path(name, "/sync"), json_data=body)
+        finally:
+            self._app_cache.pop(name, None)
 
     async def rollback_application(
         self, name: str, revision_id: int, dry_run: bool = True
     ) -> dict[str, Any]:
         """Rollback application to previous revision. Dry-run by default."""
         body = {"id": revision_id, "dryRun": dry_run}
-        return await self._request("POST", f"/applications/{name}/rollback", json_data=body)
+        try:
+            return await self._request("POST", _app_path(name, "/rollback"), json_data=body)
+        finally:
+            self._app_cache.pop(name, None)
 
     async def refresh_application(self, name: str, hard: bool = False) -> Application:
         """Refresh application manifest from Git. Use hard=True to invalidate cache."""
-        params = {"refresh": "hard" if hard else "normal"}
-        data = await self._request("GET", f"/applications/{name}", params=params)
-        return Application.from_api_response(data)
+        data, _ = await self._send("GET", _app_path(name), params=_REFRESH_PARAMS[hard])
+        app = self._parse_application(data)
+        self._cache_application(name, app, time.monotonic())
+        return app
 
     async def terminate_sync(self, name: str) -> dict[str, Any]:
         """Terminate ongoing sync operation."""
-        return await self._request("DELETE", f"/applications/{name}/operation")
+        try:
+            return await self._request("DELETE", _app_path(name, "/operation"))
+        finally:
+            self._app_cache.pop(name, None)
 
     async def delete_application(self, name: str, cascade: bool = True) -> dict[str, Any]:
         """Delete application. cascade=True also deletes managed resources."""
-        params = {"cascade": str(cascade).lower()}
-        return await self._request("DELETE", f"/applications/{name}", params=params)
+        try:
+            return await self._request("DELETE", _app_path(name), params=_CASCADE_PARAMS[cascade])
+        finally:
+            self._app_cache.pop(name, None)
 
     # Cluster and Project Operations
 
     async def list_clusters(self) -> list[dict[str, Any]]:
         """List registered Kubernetes clusters."""
-        data = await self._request("GET", "/clusters")
-        items = data.get("items", [])
-        return list(items) if isinstance(items, list) else []
+        return await self._request_items("/clusters")
 
     async def list_projects(self) -> list[dict[str, Any]]:
         """List ArgoCD projects."""
-        data = await self._request("GET", "/projects")
-        items = data.get("items", [])
-        return list(items) if isinstance(items, list) else []
+        return await self._request_items("/projects")
 
     async def get_settings(self) -> dict[str, Any]:
         """Get ArgoCD server settings."""
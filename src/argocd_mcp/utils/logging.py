@@ -5,28 +5,75 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import json
 import logging
-import uuid
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+    from collections.abc import Callable, MutableMapping
     from pathlib import Path
 
+# orjson is an optional speedup, as in the API client. It serializes straight
+# to bytes, so JSON log lines can skip the text layer via BytesLoggerFactory.
+# Unlike json, orjson rejects non-str dict keys unless OPT_NON_STR_KEYS is set;
+# the option makes it stringify them the same way the stdlib encoder does.
+_orjson_dumps: Callable[..., bytes] | None
+_orjson_options = 0
+try:
+    _orjson = importlib.import_module("orjson")
+except ImportError:
+    _orjson_dumps = None
+else:
+    _orjson_dumps = _orjson.dumps
+    _orjson_options = _orjson.OPT_NON_STR_KEYS
+
+# One reusable compact encoder for audit file lines. json.dumps() with default
+# arguments also reuses a shared encoder, but with ", " / ": " separators; the
+# compact form is smaller on disk and equally valid JSON Lines. Values JSON
+# cannot represent (exceptions, paths, ...) are written as their str().
+_json_encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _encode_audit_entry(entry: dict[str, Any]) -> bytes:
+    """Serialize one audit entry to compact UTF-8 JSON, with orjson when installed."""
+    if _orjson_dumps is not None:
+        return _orjson_dumps(entry, default=str, option=_orjson_options)
+    return _json_encode(entry).encode()
+
+
+# fdatasync is POSIX-only; fall back to fsync elsewhere (e.g. macOS, Windows).
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# Audit writes are synced to disk at most once per AUDIT_SYNC_INTERVAL seconds,
+# or sooner once AUDIT_SYNC_ENTRIES entries are waiting; close() syncs the rest.
+# Between syncs the kernel coalesces the appends.
+AUDIT_SYNC_INTERVAL = 1.0
+AUDIT_SYNC_ENTRIES = 100
+
+# Audit lines longer than this have their details replaced by a size marker so
+# one oversized payload cannot bloat the file or stall the writer.
+AUDIT_LINE_MAX_BYTES = 4096
+
 # Async-safe correlation ID storage
 correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
 
 
 def get_correlation_id() -> str:
-    """Get current correlation ID or generate new one (8 chars from UUID4)."""
+    """Get current correlation ID or generate new one (8 hex chars, 32 random bits)."""
     cid = correlation_id.get()
     if not cid:
-        cid = str(uuid.uuid4())[:8]
+        # Same 8 hex chars as str(uuid4())[:8] without building a UUID object.
+        cid = os.urandom(4).hex()
         correlation_id.set(cid)
     return cid
 
@@ -42,7 +89,9 @@ def add_correlation_id(
     event_dict: MutableMapping[str, Any],
 ) -> MutableMapping[str, Any]:
     """Structlog processor that adds correlation_id to all log events."""
-    event_dict["correlation_id"] = get_correlation_id()
+    # Plain ContextVar read once an ID exists; only the first event in a
+    # context without one goes through get_correlation_id() to create it.
+    event_dict["correlation_id"] = correlation_id.get() or get_correlation_id()
     return event_dict
 
 
@@ -61,7 +110,13 @@ def configure_logging(level: str = "INFO", json_output: bool = False) -> None:
         add_correlation_id,
     ]
 
-    if json_output:
+    logger_factory: Any = structlog.PrintLoggerFactory()
+    if json_output and _orjson_dumps is not None:
+        processors.append(
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps, option=_orjson_options)
+        )
+        logger_factory = structlog.BytesLoggerFactory()
+    elif json_output:
         processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
@@ -72,13 +127,23 @@ def configure_logging(level: str = "INFO", json_output: bool = False) -> None:
             getattr(logging, level.upper(), logging.INFO)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
 class AuditLogger:
-    """Audit logger for recording all operations (file or stdout)."""
+    """Audit logger for recording all operations (file or stdout).
+
+    File entries are appended to an in-memory batch. Inside a running event
+    loop (i.e. from tool handlers) the batch is drained by a single background
+    writer thread, so the loop is not blocked on open/write/close; entries
+    logged while a drain is pending ride along in the same write. Outside an
+    event loop the batch is drained inline, so the entry is on disk when log()
+    returns. The file is reopened per batch rather than held open, which keeps
+    external log rotation working. Writes are synced to disk on an interval or
+    entry count rather than per entry (see AUDIT_SYNC_INTERVAL).
+    """
 
     def __init__(self, log_path: Path | None = None) -> None:
         """
@@ -89,6 +154,32 @@ class AuditLogger:
         """
         self._log_path = log_path
         self._logger = structlog.get_logger("audit")
+        self._writer: ThreadPoolExecutor | None = None
+        self._batch: list[bytes] = []
+        # _batch_lock guards the list and is only held for an append or swap;
+        # _write_lock serializes drains so batches reach the file in order.
+        self._batch_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # Entries written since the last sync and when that sync happened;
+        # both only change under _write_lock.
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last entry; stored as one
+        # tuple so a concurrent reader never sees a mismatched pair.
+        self._second: tuple[int, str] = (-1, "")
+
+    def _timestamp(self) -> str:
+        """Return the current UTC time in ISO 8601 with microseconds.
+
+        Equivalent to datetime.now(UTC).isoformat(timespec="microseconds");
+        the date-time prefix is only reformatted when the second changes.
+        """
+        sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+        cached_sec, prefix = self._second
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._second = (sec, prefix)
+        return f"{prefix}.{us:06d}+00:00"
 
     def log(
         self,
@@ -106,8 +197,15 @@ class AuditLogger:
             result: Outcome ("success", "blocked", "error")
             details: Additional context dict
         """
+        if not self._log_path:
+            # structlog adds the timestamp and correlation ID itself, and the
+            # filtering logger drops the call outright if INFO is disabled, so
+            # the file entry is never built for stdout.
+            self._logger.info("audit", action=action, target=target, result=result, details=details)
+            return
+
         entry: dict[str, Any] = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._timestamp(),
             "correlation_id": get_correlation_id(),
             "action": action,
             "target": target,
@@ -116,11 +214,108 @@ class AuditLogger:
         if details:
             entry["details"] = details
 
-        if self._log_path:
-            with self._log_path.open("a") as f:
-                f.write(json.dumps(entry) + "\n")
+        with self._batch_lock:
+            self._batch.append(self._encode(entry) + b"\n")
+            first = len(self._batch) == 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._drain()
         else:
-            self._logger.info("audit", action=action, target=target, result=result, details=details)
+            # A drain already queued will pick this entry up as well.
+            if first:
+                if self._writer is None:
+                    self._writer = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="audit-writer"
+                    )
+                self._writer.submit(self._drain_in_background)
+
+    @staticmethod
+    def _encode(entry: dict[str, Any]) -> bytes:
+        """Serialize an entry, trimming details that push it past AUDIT_LINE_MAX_BYTES."""
+        line = _encode_audit_entry(entry)
+        if len(line) > AUDIT_LINE_MAX_BYTES and "details" in entry:
+            trimmed = {**entry, "details": {"truncated": True, "size": len(line)}}
+            line = _encode_audit_entry(trimmed)
+        return line
+
+    def _drain(self) -> None:
+        """Append every batched entry to the audit file in one write.
+
+        If the write fails the entries are put back at the head of the batch
+        before the OSError propagates, so nothing is dropped silently.
+        """
+        with self._write_lock:
+            with self._batch_lock:
+                lines, self._batch = self._batch, []
+            if lines and self._log_path:
+                now = time.monotonic()
+                pending = self._unsynced + len(lines)
+                sync = pending >= AUDIT_SYNC_ENTRIES or now - self._last_sync >= AUDIT_SYNC_INTERVAL
+                try:
+                    self._append_bytes(self._log_path, b"".join(lines), sync=sync)
+                except OSError:
+                    with self._batch_lock:
+                        self._batch[:0] = lines
+                    raise
+                if sync:
+                    self._unsynced, self._last_sync = 0, now
+                else:
+                    self._unsynced = pending
+
+    def _drain_in_background(self) -> None:
+        """Drain from the writer thread, where nobody would see a raised error.
+
+        A failed write is logged, and the unwritten entries are copied to
+        stderr so the audit trail survives in the process output.
+        """
+        try:
+            self._drain()
+        except OSError as exc:
+            with self._batch_lock:
+                lines, self._batch = self._batch, []
+            self._logger.error(
+                "Audit log write failed",
+                path=str(self._log_path),
+                error=str(exc),
+                entries=len(lines),
+            )
+            sys.stderr.write(b"".join(lines).decode(errors="replace"))
+            sys.stderr.flush()
+
+    @staticmethod
+    def _append_bytes(path: Path, data: bytes, *, sync: bool) -> None:
+        """Append data to path with O_APPEND through a raw file descriptor.
+
+        Entries are already serialized to bytes, so Python's buffered file
+        layer would only add a copy. O_APPEND makes each write land at the
+        current end of file even if another process appends concurrently.
+        The mode matches open("a"): 0o666 before the umask.
+
+        With sync=True the file is synced after the write, covering every
+        earlier unsynced append too. fdatasync skips the inode timestamp flush
+        where available.
+        """
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if sync:
+                _datasync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Wait for queued file writes, sync them to disk, and stop the writer thread."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self._drain()
+        with self._write_lock:
+            if self._unsynced and self._log_path:
+                self._append_bytes(self._log_path, b"", sync=True)
+                self._unsynced, self._last_sync = 0, time.monotonic()
 
     def log_read(self, action: str, target: str) -> None:
         """Log a successful read operation."""
@@ -6,8 +6,9 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -17,8 +18,17 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Impact text shown in ConfirmationRequired, keyed by destructive operation.
+_IMPACT_DESCRIPTIONS: dict[str, str] = {
+    "delete_application": "Application and all managed resources will be PERMANENTLY DELETED",
+    "sync_with_prune": "Resources not in Git will be DELETED from cluster",
+    "sync_with_force": "Resources will be replaced, potentially causing downtime",
+    "rollback": "Application will revert to previous state, may cause service disruption",
+}
+_DEFAULT_IMPACT = "This operation may have significant impact"
 
-@dataclass
+
+@dataclass(slots=True)
 class ConfirmationRequired:
     """Response indicating confirmation is required for destructive operation."""
 
@@ -30,22 +40,29 @@ class ConfirmationRequired:
 
     def format_message(self) -> str:
         """Format confirmation request for agent consumption."""
-        lines = [
-            f"CONFIRMATION REQUIRED: {self.operation}",
-            "",
-            f"Target: {self.target}",
-            f"Impact: {self.impact}",
-        ]
-        if self.details:
-            lines.append("")
-            lines.append("Details:")
-            for key, value in self.details.items():
-                lines.append(f"  {key}: {value}")
-        lines.extend(["", self.confirmation_instructions])
-        return "\n".join(lines)
-
-
-@dataclass
+        header = (
+            f"CONFIRMATION REQUIRED: {self.operation}\n\n"
+            f"Target: {self.target}\n"
+            f"Impact: {self.impact}\n"
+        )
+        if not self.details:
+            return f"{header}\n{self.confirmation_instructions}"
+        details = "".join(f"  {key}: {value}\n" for key, value in self.details.items())
+        return f"{header}\nDetails:\n{details}\n{self.confirmation_instructions}"
+
+
+@lru_cache(maxsize=256)
+def _format_blocked(operation: str, reason: str, setting: str) -> str:
+    """Render a blocked message; the inputs repeat per (operation, setting) pair."""
+    return (
+        f"OPERATION BLOCKED: {operation}\n"
+        f"Reason: {reason}\n"
+        f"Setting: {setting}\n"
+        f"To enable: Set {setting}=false in server configuration"
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class OperationBlocked:
     """Response indicating operation is blocked by security settings."""
 
@@ -55,12 +72,7 @@ class OperationBlocked:
 
     def format_message(self) -> str:
         """Format blocked message for agent consumption."""
-        return (
-            f"OPERATION BLOCKED: {self.operation}\n"
-            f"Reason: {self.reason}\n"
-            f"Setting: {self.setting}\n"
-            f"To enable: Set {self.setting}=false in server configuration"
-        )
+        return _format_blocked(self.operation, self.reason, self.setting)
 
 
 class RateLimiter:
@@ -77,30 +89,33 @@ class RateLimiter:
         self._max_calls = max_calls
         self._window = window_seconds
         # Per-key call timestamps. Keys are operation names like
-        # "read:list_applications" — a small fixed cardinality dictated by
+        # "list_applications" — a small fixed cardinality dictated by
         # the registered MCP tools, so the dict never grows unbounded. If
         # callers ever start passing per-target keys (e.g. including the
         # application name), revisit this and add explicit eviction.
-        self._calls: dict[str, list[float]] = defaultdict(list)
+        # Each key keeps a ring of its last max_calls accepted timestamps: a
+        # deque bounded by maxlen drops the oldest on append. A call is allowed
+        # unless the ring is full and its oldest entry is still in the window.
+        ring_size = max(max_calls, 0)
+        self._calls: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=ring_size))
 
     def check(self, key: str) -> bool:
         """
         Check if operation is allowed.
 
         Args:
-            key: Rate limit key (e.g., "read:list_apps")
+            key: Rate limit key (e.g., "list_applications")
 
         Returns:
             True if allowed, False if rate limited.
         """
-        now = time.time()
-        self._calls[key] = [t for t in self._calls[key] if now - t < self._window]
-
-        if len(self._calls[key]) >= self._max_calls:
-            logger.warning("Rate limit exceeded", key=key, calls=len(self._calls[key]))
+        now = time.monotonic()
+        calls = self._calls[key]
+        if len(calls) >= self._max_calls and (not calls or now - calls[0] < self._window):
+            logger.warning("Rate limit exceeded", key=key, calls=len(calls))
             return False
 
-        self._calls[key].append(now)
+        calls.append(now)
         return True
 
     def reset(self, key: str | None = None) -> None:
@@ -122,7 +137,19 @@ class SafetyGuard:
             settings: Security settings from configuration.
         """
         self._settings = settings
-        self._rate_limiter = RateLimiter(
+        # The guard flags are read on every tool call; settings are loaded once
+        # at startup and never change, so copy them out of the pydantic model.
+        self._read_only = settings.read_only
+        self._disable_destructive = settings.disable_destructive
+        self._single_cluster = settings.single_cluster
+        # Reads and writes are limited independently; separate limiters keyed
+        # by the bare operation name avoid building a "read:"/"write:" key on
+        # every check.
+        self._read_limiter = RateLimiter(
+            max_calls=settings.rate_limit_calls,
+            window_seconds=settings.rate_limit_window,
+        )
+        self._write_limiter = RateLimiter(
             max_calls=settings.rate_limit_calls,
             window_seconds=settings.rate_limit_window,
         )
@@ -134,7 +161,7 @@ class SafetyGuard:
         Returns:
             OperationBlocked if rate limited, None if allowed.
         """
-        if not self._rate_limiter.check(f"read:{operation}"):
+        if not self._read_limiter.check(operation):
             return OperationBlocked(
                 operation=operation,
                 reason="Rate limit exceeded",
@@ -149,14 +176,14 @@ class SafetyGuard:
         Returns:
             OperationBlocked if blocked, None if allowed.
         """
-        if self._settings.read_only:
+        if self._read_only:
             return OperationBlocked(
                 operation=operation,
                 reason="Server is running in read-only mode",
                 setting="MCP_READ_ONLY",
             )
 
-        if not self._rate_limiter.check(f"write:{operation}"):
+        if not self._write_limiter.check(operation):
             return OperationBlocked(
                 operation=operation,
                 reason="Rate limit exceeded",
@@ -187,7 +214,7 @@ class SafetyGuard:
         if write_check:
             return write_check
 
-        if self._settings.disable_destructive:
+        if self._disable_destructive:
             return OperationBlocked(
                 operation=operation,
                 reason="Destructive operations are disabled",
@@ -237,7 +264,7 @@ class SafetyGuard:
         URL form (`https://kubernetes.default.svc`) and the friendly name
         (`in-cluster`) since ArgoCD emits whichever was configured.
         """
-        if self._settings.single_cluster and cluster not in self._IN_CLUSTER_IDENTIFIERS:
+        if self._single_cluster and cluster not in self._IN_CLUSTER_IDENTIFIERS:
             return OperationBlocked(
                 operation=operation,
                 reason=f"Operation on cluster '{cluster}' blocked in single-cluster mode",
@@ -248,12 +275,4 @@ class SafetyGuard:
     @staticmethod
     def _get_impact_description(operation: str) -> str:
         """Get human-readable impact description for destructive operation."""
-        impacts = {
-            "delete_application": (
-                "Application and all managed resources will be PERMANENTLY DELETED"
-            ),
-            "sync_with_prune": "Resources not in Git will be DELETED from cluster",
-            "sync_with_force": "Resources will be replaced, potentially causing downtime",
-            "rollback": "Application will revert to previous state, may cause service disruption",
-        }
-        return impacts.get(operation, "This operation may have significant impact")
+        return _IMPACT_DESCRIPTIONS.get(operation, _DEFAULT_IMPACT)
@@ -1,13 +1,29 @@
 # ABOUTME: Unit tests for ArgoCD API client
 # ABOUTME: Tests client initialization, request handling, and response parsing
 
+import asyncio
+import random
+import re
+from unittest.mock import AsyncMock, patch
+
 import httpx
 import pytest
 import respx
 from pydantic import SecretStr
 
+import argocd_mcp.utils.client as client_module
 from argocd_mcp.config import ArgocdInstance
-from argocd_mcp.utils.client import Application, ArgocdClient, ArgocdError
+from argocd_mcp.utils.client import (
+    APPLICATION_CACHE_TTL,
+    DEFAULT_POOL_LIMITS,
+    MASK_OFFLOAD_BYTES,
+    RETRY_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    Application,
+    ArgocdClient,
+    ArgocdError,
+    _retry_delay,
+)
 
 BASE_URL = "https://argocd.example.com/api/v1"
 
@@ -136,6 +152,23 @@ class TestApplication:
         assert app.sync_status == "Unknown"
         assert app.health_status == "Unknown"
 
+    def test_from_api_response_with_null_sections(self):
+        """Test explicit null sections fall back to defaults instead of raising."""
+        response = {
+            "metadata": {"name": "null-app"},
+            "spec": {"source": None, "destination": None},
+            "status": {"sync": None, "health": None},
+        }
+
+        app = Application.from_api_response(response)
+
+        assert app.name == "null-app"
+        assert app.repo_url == ""
+        assert app.target_revision == "HEAD"
+        assert app.destination_server == ""
+        assert app.sync_status == "Unknown"
+        assert app.health_status == "Unknown"
+
     def test_from_api_response_with_resources(self):
         """Test creating Application with resources list."""
         response = {
@@ -188,6 +221,13 @@ class TestArgocdError:
         assert error.message == "Internal server error"
         assert error.details is None
 
+    def test_args_hold_raw_message_and_str_is_formatted(self):
+        """Test str() renders the full message while args carries only the raw message."""
+        error = ArgocdError(code=503, message="Unavailable", details="upstream down")
+
+        assert error.args == ("Unavailable",)
+        assert str(error) == "ArgoCD API error (503): Unavailable - upstream down"
+
 
 @pytest.mark.unit
 class TestArgocdClient:
@@ -266,6 +306,43 @@ class TestArgocdClient:
 
         assert result["token"] == "visible-secret"
 
+    def test_mask_response_string_without_keywords_returned_as_is(
+        self, mock_argocd_instance: ArgocdInstance
+    ):
+        """Strings with no secret keyword skip the regex pass and are returned unchanged."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        value = "https://kubernetes.default.svc: Synced=true"
+        assert client._mask_response(value) is value
+
+    def test_mask_response_shortest_secret_is_masked(self, mock_argocd_instance: ArgocdInstance):
+        """Test the length short-circuit does not skip the shortest maskable string."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        assert client._mask_response("token=x") == "token=***MASKED***"
+        assert client._mask_response("token=") == "token="
+
+    def test_mask_response_long_and_repeated_strings(self, mock_argocd_instance: ArgocdInstance):
+        """Test masking is identical for cached short strings and uncached long ones."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        short = "password=hunter2"
+        long_value = "x" * 600 + " password=hunter2"
+
+        assert client._mask_response([short, short]) == ["password=***MASKED***"] * 2
+        assert client._mask_response(long_value) == "x" * 600 + " password=***MASKED***"
+
+    def test_mask_response_string_keeps_prefix_before_first_keyword(
+        self, mock_argocd_instance: ArgocdInstance
+    ):
+        """Text ahead of the first keyword is preserved verbatim; later secrets are masked."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        value = "sync failed: hook exited 1; token=abc123 password: hunter2"
+        result = client._mask_response(value)
+
+        assert result == ("sync failed: hook exited 1; token=***MASKED*** password: ***MASKED***")
+
     def test_mask_response_bearer_token(self, mock_argocd_instance: ArgocdInstance):
         """Test masking Bearer tokens in strings."""
         client = ArgocdClient(mock_argocd_instance)
@@ -276,6 +353,70 @@ class TestArgocdClient:
         assert "eyJhbGciOiJIUzI1NiJ9" not in result
         assert "***MASKED***" in result
 
+    def test_mask_response_string_with_mixed_secret_kinds(
+        self, mock_argocd_instance: ArgocdInstance
+    ):
+        """Test keyed and bearer secrets in one string are all masked."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        value = "Authorization: Bearer abc.def api-key=k123 secret: s3"
+        result = client._mask_response(value)
+
+        assert result == (
+            "Authorization: Bearer ***MASKED*** api-key=***MASKED*** secret: ***MASKED***"
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                "invalid bearer token: eyJhbGciOiJIUzI1NiJ9.payload",
+                "invalid bearer ***MASKED*** ***MASKED***",
+            ),
+            ("Bearer api_key: K123", "Bearer ***MASKED*** ***MASKED***"),
+            ("api_key=xpasswordpassword :x", "api_key=***MASKED*** :***MASKED***"),
+            (
+                "Authorization: Bearer\xa0eyJhbGciOi.payload",
+                "Authorization: Bearer\xa0***MASKED***",
+            ),
+            ("Bearer\u3000abc.def", "Bearer\u3000***MASKED***"),
+            ("password:\u2003hunter22", "password:\u2003***MASKED***"),
+        ],
+    )
+    def test_mask_response_keyword_after_masked_value(
+        self, mock_argocd_instance: ArgocdInstance, value: str, expected: str
+    ):
+        """Test a secret following a keyword consumed by an earlier match is still masked."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        assert client._mask_response(value) == expected
+
+    def test_mask_response_matches_sequential_reference(self, mock_argocd_instance: ArgocdInstance):
+        """Test string masking agrees with the five sequential reference substitutions."""
+        flags = re.IGNORECASE
+        keyed = r"[\"']?\s*[:=]\s*[\"']?)[^\"'\s,}]+"
+        reference = [
+            (re.compile(f"(token{keyed}", flags), r"\1***MASKED***"),
+            (re.compile(f"(password{keyed}", flags), r"\1***MASKED***"),
+            (re.compile(f"(secret{keyed}", flags), r"\1***MASKED***"),
+            (re.compile(f"(api[_-]?key{keyed}", flags), r"\1***MASKED***"),
+            (re.compile(r"(bearer\s+)[^\s\"']+", flags), r"\1***MASKED***"),
+        ]
+        pieces = [
+            "token", "Token", "password", "secret", "api_key", "api-key", "apikey",
+            "bearer", "Bearer", " ", "\t", "\xa0", "\u3000", ":", "=", '"', "'", ",", "}",
+            "x", "K123", "eyJ.a",
+        ]  # fmt: skip
+        client = ArgocdClient(mock_argocd_instance)
+        rng = random.Random(0)
+
+        for _ in range(5000):
+            value = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 10)))
+            expected = value
+            for pattern, replacement in reference:
+                expected = pattern.sub(replacement, expected)
+            assert client._mask_response(value) == expected, value
+
     def test_mask_response_api_key(self, mock_argocd_instance: ArgocdInstance):
         """Test masking api_key in dicts."""
         client = ArgocdClient(mock_argocd_instance)
@@ -333,22 +474,31 @@ class TestArgocdClient:
 
         assert result == data
 
-    def test_mask_response_depth_limit_does_not_overflow(
-        self, mock_argocd_instance: ArgocdInstance
-    ):
-        """Pathologically deep input must not blow the stack."""
+    def test_mask_response_deep_input_does_not_overflow(self, mock_argocd_instance: ArgocdInstance):
+        """Pathologically deep input must not blow the stack and is masked at every level."""
         client = ArgocdClient(mock_argocd_instance)
 
-        # Build a structure deeper than _MAX_MASK_DEPTH (64). Any reasonable
-        # ArgoCD response is well under 20 levels deep; this is purely a
-        # cycle / pathological-input guard.
-        data: dict = {"v": "ok"}
-        for _ in range(200):
-            data = {"nested": data}
+        # Far deeper than the interpreter recursion limit; any reasonable
+        # ArgoCD response is well under 20 levels deep.
+        data: dict = {"token": "deep-secret", "v": "ok"}
+        for _ in range(5000):
+            data = {"nested": [data]}
 
-        # Must return without raising RecursionError.
         result = client._mask_response(data)
-        assert isinstance(result, dict)
+
+        for _ in range(5000):
+            result = result["nested"][0]
+        assert result == {"token": "***MASKED***", "v": "ok"}
+
+    def test_mask_response_does_not_mutate_input(self, mock_argocd_instance: ArgocdInstance):
+        """Test masking returns copies and leaves the parsed response untouched."""
+        client = ArgocdClient(mock_argocd_instance)
+
+        data = {"items": [{"password": "hunter2", "name": "app"}]}
+        result = client._mask_response(data)
+
+        assert result["items"][0]["password"] == "***MASKED***"
+        assert data["items"][0]["password"] == "hunter2"
 
     async def test_context_manager_not_entered(self, mock_argocd_instance: ArgocdInstance):
         """Test that client raises when not in context manager."""
@@ -373,6 +523,15 @@ class TestArgocdClientContextManager:
 
         assert client._client is None
 
+    async def test_context_manager_configures_pool_limits(self, instance: ArgocdInstance):
+        """Test the httpx client keeps idle connections alive across tool calls."""
+        with patch.object(httpx, "AsyncClient", wraps=httpx.AsyncClient) as client_cls:
+            async with ArgocdClient(instance):
+                pass
+
+        assert client_cls.call_args.kwargs["limits"] == DEFAULT_POOL_LIMITS
+        assert DEFAULT_POOL_LIMITS.keepalive_expiry == 60.0
+
     async def test_context_manager_returns_self(self, instance: ArgocdInstance):
         """Test async with returns the client instance."""
         client = ArgocdClient(instance)
@@ -380,6 +539,36 @@ class TestArgocdClientContextManager:
         async with client as c:
             assert c is client
 
+    async def test_nested_context_reuses_open_client(self, instance: ArgocdInstance):
+        """Test re-entering an open client shares its pool and only the outer exit closes it."""
+        client = ArgocdClient(instance)
+
+        async with client:
+            pooled = client._client
+            async with client:
+                assert client._client is pooled
+            assert client._client is pooled
+
+        assert client._client is None
+
+    @respx.mock
+    async def test_warmup_sends_head_request(self, instance: ArgocdInstance):
+        """Test warmup opens a connection with a HEAD /settings."""
+        route = respx.head(f"{BASE_URL}/settings").mock(return_value=httpx.Response(200))
+
+        async with ArgocdClient(instance) as client:
+            await client.warmup()
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_warmup_swallows_transport_errors(self, instance: ArgocdInstance):
+        """Test a failed warmup is not raised to the caller."""
+        respx.head(f"{BASE_URL}/settings").mock(side_effect=httpx.ConnectError("refused"))
+
+        async with ArgocdClient(instance) as client:
+            await client.warmup()
+
 
 @pytest.mark.unit
 class TestArgocdClientRequest:
@@ -447,13 +636,31 @@ class TestArgocdClientRequest:
             return_value=httpx.Response(502, text="Bad Gateway")
         )
 
-        async with ArgocdClient(instance) as client:
-            with pytest.raises(ArgocdError) as exc_info:
-                await client._request("GET", "/applications")
+        # Gateway errors are retried for GET; skip the real backoff sleeps.
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()):
+            async with ArgocdClient(instance) as client:
+                with pytest.raises(ArgocdError) as exc_info:
+                    await client._request("GET", "/applications")
 
         assert exc_info.value.code == 502
         assert exc_info.value.details is not None
 
+    @respx.mock
+    async def test_request_truncates_large_non_json_error_body(self, instance: ArgocdInstance):
+        """Test a large non-JSON error page is cut to its first 200 bytes in details."""
+        respx.get(f"{BASE_URL}/applications").mock(
+            return_value=httpx.Response(503, content=b"<html>" + b"x" * 5000)
+        )
+
+        # Gateway errors are retried for GET; skip the real backoff sleeps.
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()):
+            async with ArgocdClient(instance) as client:
+                with pytest.raises(ArgocdError) as exc_info:
+                    await client._request("GET", "/applications")
+
+        assert exc_info.value.message == "HTTP 503"
+        assert exc_info.value.details == "<html>" + "x" * 194
+
     @respx.mock
     async def test_request_handles_error_with_details(self, instance: ArgocdInstance):
         """Test _request extracts error details from JSON response."""
@@ -484,6 +691,49 @@ class TestArgocdClientRequest:
         assert result["token"] == "***MASKED***"
         assert result["version"] == "2.8"
 
+    @respx.mock
+    async def test_request_skips_masking_when_disabled(self, instance: ArgocdInstance):
+        """Test _request returns the parsed body untouched when mask_secrets=False."""
+        respx.get(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(200, json={"token": "super-secret", "version": "2.8"})
+        )
+
+        async with ArgocdClient(instance, mask_secrets=False) as client:
+            result = await client._request("GET", "/settings")
+
+        assert result == {"token": "super-secret", "version": "2.8"}
+
+    @respx.mock
+    async def test_request_masks_large_body_in_worker_thread(self, instance: ArgocdInstance):
+        """Test bodies over MASK_OFFLOAD_BYTES are masked via asyncio.to_thread."""
+        body = {"token": "super-secret", "blob": "x" * MASK_OFFLOAD_BYTES}
+        respx.get(f"{BASE_URL}/applications/big/resource-tree").mock(
+            return_value=httpx.Response(200, json=body)
+        )
+
+        with patch(
+            "argocd_mcp.utils.client.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            async with ArgocdClient(instance) as client:
+                result = await client.get_resource_tree("big")
+
+        to_thread.assert_called_once()
+        assert result["token"] == "***MASKED***"
+
+    @respx.mock
+    async def test_request_masks_small_body_inline(self, instance: ArgocdInstance):
+        """Test ordinary small bodies are masked on the event loop."""
+        respx.get(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(200, json={"token": "super-secret"})
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.to_thread") as to_thread:
+            async with ArgocdClient(instance) as client:
+                result = await client._request("GET", "/settings")
+
+        to_thread.assert_not_called()
+        assert result == {"token": "***MASKED***"}
+
     @respx.mock
     async def test_request_with_query_params(self, instance: ArgocdInstance):
         """Test _request passes query parameters."""
@@ -522,6 +772,184 @@ class TestArgocdClientRequest:
         assert result == {}
 
 
+@pytest.mark.unit
+class TestArgocdClientRetry:
+    """Tests for transient-failure retry handling in ArgocdClient._request."""
+
+    @respx.mock
+    async def test_retries_timeout_then_succeeds(self, instance: ArgocdInstance):
+        """A transient timeout is retried and the later response is returned."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            side_effect=[httpx.ReadTimeout("slow"), httpx.Response(200, json={"ok": True})]
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with ArgocdClient(instance) as client:
+                result = await client._request("GET", "/settings")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+        sleep.assert_awaited_once()
+
+    @respx.mock
+    async def test_reraises_timeout_after_last_attempt(self, instance: ArgocdInstance):
+        """The original timeout propagates once every attempt has failed."""
+        route = respx.get(f"{BASE_URL}/settings").mock(side_effect=httpx.ConnectTimeout("down"))
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with ArgocdClient(instance) as client:
+                with pytest.raises(httpx.ConnectTimeout):
+                    await client._request("GET", "/settings")
+
+        assert route.call_count == RETRY_ATTEMPTS
+        assert sleep.await_count == RETRY_ATTEMPTS - 1
+
+    @respx.mock
+    async def test_http_errors_are_not_retried(self, instance: ArgocdInstance):
+        """HTTP error responses surface immediately as ArgocdError."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(500, json={"message": "boom"})
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError):
+                await client._request("GET", "/settings")
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_retries_connect_error_then_succeeds(self, instance: ArgocdInstance):
+        """A refused connection is retried."""
+        route = respx.post(f"{BASE_URL}/settings").mock(
+            side_effect=[httpx.ConnectError("refused"), httpx.Response(200, json={"ok": True})]
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()):
+            async with ArgocdClient(instance) as client:
+                result = await client._request("POST", "/settings")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    @pytest.mark.parametrize("method", ["POST", "DELETE"])
+    @pytest.mark.parametrize("error", [httpx.ReadTimeout, httpx.WriteTimeout])
+    @respx.mock
+    async def test_sent_write_timeout_is_not_retried(
+        self, instance: ArgocdInstance, method: str, error: type[httpx.TimeoutException]
+    ):
+        """A write that timed out after being sent is not replayed; it may have been applied."""
+        route = respx.route(method=method, url=f"{BASE_URL}/settings").mock(
+            side_effect=error("slow")
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with ArgocdClient(instance) as client:
+                with pytest.raises(error):
+                    await client._request(method, "/settings")
+
+        assert route.call_count == 1
+        sleep.assert_not_awaited()
+
+    @pytest.mark.parametrize("error", [httpx.ConnectTimeout, httpx.PoolTimeout])
+    @respx.mock
+    async def test_unsent_write_timeout_is_retried(
+        self, instance: ArgocdInstance, error: type[httpx.TimeoutException]
+    ):
+        """A write that timed out before it was sent is retried."""
+        route = respx.post(f"{BASE_URL}/settings").mock(
+            side_effect=[error("busy"), httpx.Response(200, json={"ok": True})]
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()):
+            async with ArgocdClient(instance) as client:
+                result = await client._request("POST", "/settings")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_protocol_error_on_write_is_not_retried(self, instance: ArgocdInstance):
+        """A connection dropped mid-response is not replayed for non-GET requests."""
+        route = respx.post(f"{BASE_URL}/settings").mock(
+            side_effect=httpx.RemoteProtocolError("peer closed")
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(httpx.RemoteProtocolError):
+                await client._request("POST", "/settings")
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_retries_throttled_response_honouring_retry_after(self, instance: ArgocdInstance):
+        """A 429 is retried after the server's Retry-After delay."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with ArgocdClient(instance) as client:
+                result = await client._request("GET", "/settings")
+
+        assert result == {"ok": True}
+        assert route.call_count == 2
+        sleep.assert_awaited_once_with(2.0)
+
+    @respx.mock
+    async def test_retry_after_zero_retries_immediately(self, instance: ArgocdInstance):
+        """A Retry-After of 0 is honoured rather than replaced by the backoff delay."""
+        respx.get(f"{BASE_URL}/settings").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"ok": True}),
+            ]
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with ArgocdClient(instance) as client:
+                await client._request("GET", "/settings")
+
+        sleep.assert_awaited_once_with(0.0)
+
+    @respx.mock
+    async def test_gateway_error_raises_after_last_attempt(self, instance: ArgocdInstance):
+        """A persistent 503 on GET is retried, then raised as ArgocdError."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(503, json={"message": "unavailable"})
+        )
+
+        with patch("argocd_mcp.utils.client.asyncio.sleep", new=AsyncMock()):
+            async with ArgocdClient(instance) as client:
+                with pytest.raises(ArgocdError) as exc_info:
+                    await client._request("GET", "/settings")
+
+        assert exc_info.value.code == 503
+        assert route.call_count == RETRY_ATTEMPTS
+
+    @respx.mock
+    async def test_gateway_error_on_write_is_not_retried(self, instance: ArgocdInstance):
+        """A 503 on a write surfaces immediately; the write may have been applied."""
+        route = respx.post(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(503, json={"message": "unavailable"})
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError):
+                await client._request("POST", "/settings")
+
+        assert route.call_count == 1
+
+    def test_retry_delay_is_jittered_and_capped(self):
+        """Backoff grows exponentially, stays within [0.5, 1) of nominal, and is capped."""
+        for _ in range(50):
+            assert 0.5 <= _retry_delay(1) < 1.0
+            assert 1.0 <= _retry_delay(2) < 2.0
+            assert _retry_delay(10) < RETRY_MAX_DELAY
+
+
 @pytest.mark.unit
 class TestArgocdClientListApplications:
     """Tests for ArgocdClient.list_applications method."""
@@ -575,6 +1003,42 @@ class TestArgocdClientListApplications:
 
         assert apps == []
 
+    def test_orjson_parser_used_when_installed(self):
+        """Test responses are parsed with orjson.loads when the fast extra is installed."""
+        orjson = pytest.importorskip("orjson")
+
+        assert client_module._json_loads is orjson.loads
+
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    @respx.mock
+    async def test_list_applications_with_each_json_backend(
+        self, instance: ArgocdInstance, backend: str
+    ):
+        """Test orjson and the stdlib fallback parse the same applications."""
+        loads = pytest.importorskip(backend).loads
+        respx.get(f"{BASE_URL}/applications").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "metadata": {"name": "app-ü", "namespace": "argocd"},
+                            "spec": {"source": {"repoURL": "https://git.example.com/r"}},
+                            "status": {"sync": {"status": "Synced"}},
+                        }
+                    ]
+                },
+            )
+        )
+
+        with patch("argocd_mcp.utils.client._json_loads", loads):
+            async with ArgocdClient(instance) as client:
+                apps = await client.list_applications()
+
+        assert [app.name for app in apps] == ["app-ü"]
+        assert apps[0].repo_url == "https://git.example.com/r"
+        assert apps[0].sync_status == "Synced"
+
     @respx.mock
     async def test_list_applications_with_project_filter(self, instance: ArgocdInstance):
         """Test list_applications passes project filter."""
@@ -655,6 +1119,194 @@ class TestArgocdClientGetApplication:
 
         assert exc_info.value.code == 404
 
+    @respx.mock
+    async def test_get_application_masks_only_retained_fields(self, instance: ArgocdInstance):
+        """Test secrets in kept fields are masked and discarded sections are not walked."""
+        respx.get(f"{BASE_URL}/applications/my-app").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "metadata": {"name": "my-app", "annotations": {"note": "x" * 100}},
+                    "spec": {"source": {"repoURL": "https://git/repo?token=abc12345"}},
+                    "status": {
+                        "conditions": [{"type": "SyncError", "message": "password: hunter22"}],
+                        "history": [{"id": 1}] * 20,
+                    },
+                },
+            )
+        )
+
+        async with ArgocdClient(instance) as client:
+            with patch.object(client, "_mask_response", wraps=client._mask_response) as mask:
+                app = await client.get_application("my-app")
+
+        assert app.repo_url == "https://git/repo?token=***MASKED***"
+        assert app.conditions == [{"type": "SyncError", "message": "password: ***MASKED***"}]
+        masked_inputs = [c.args[0] for c in mask.call_args_list]
+        assert not any(isinstance(v, dict) and "metadata" in v for v in masked_inputs)
+
+    @respx.mock
+    async def test_get_application_encodes_name_in_path(self, instance: ArgocdInstance):
+        """Test a name with path characters stays within its own path segment."""
+        route = respx.get(f"{BASE_URL}/applications/team%2Fapp").mock(
+            return_value=httpx.Response(200, json={"metadata": {"name": "team/app"}})
+        )
+
+        async with ArgocdClient(instance) as client:
+            app = await client.get_application("team/app")
+
+        assert route.called
+        assert app.name == "team/app"
+
+    @respx.mock
+    async def test_get_application_reuses_recent_fetch(self, instance: ArgocdInstance):
+        """Test a second lookup within the TTL is served without another request."""
+        route = respx.get(f"{BASE_URL}/applications/my-app").mock(
+            return_value=httpx.Response(200, json={"metadata": {"name": "my-app"}})
+        )
+
+        async with ArgocdClient(instance) as client:
+            first = await client.get_application("my-app")
+            second = await client.get_application("my-app")
+
+        assert second is first
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_get_application_refetches_after_ttl(self, instance: ArgocdInstance):
+        """Test an entry older than APPLICATION_CACHE_TTL is fetched again."""
+        route = respx.get(f"{BASE_URL}/applications/my-app").mock(
+            return_value=httpx.Response(200, json={"metadata": {"name": "my-app"}})
+        )
+
+        with patch("argocd_mcp.utils.client.time.monotonic") as monotonic:
+            async with ArgocdClient(instance) as client:
+                monotonic.return_value = 100.0
+                await client.get_application("my-app")
+                monotonic.return_value = 100.0 + APPLICATION_CACHE_TTL
+                await client.get_application("my-app")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_mutation_evicts_cached_application(self, instance: ArgocdInstance):
+        """Test a sync through the client drops the cached application."""
+        route = respx.get(f"{BASE_URL}/applications/my-app").mock(
+            return_value=httpx.Response(200, json={"metadata": {"name": "my-app"}})
+        )
+        respx.post(f"{BASE_URL}/applications/my-app/sync").mock(
+            return_value=httpx.Response(200, json={})
+        )
+
+        async with ArgocdClient(instance) as client:
+            await client.get_application("my-app")
+            await client.sync_application("my-app", dry_run=False)
+            await client.get_application("my-app")
+
+        assert route.call_count == 2
+
+
+@pytest.mark.unit
+class TestArgocdClientGetApplicationsBulk:
+    """Tests for ArgocdClient.get_applications_bulk method."""
+
+    @respx.mock
+    async def test_returns_apps_in_requested_order(self, instance: ArgocdInstance):
+        """Test results follow the order of the requested names."""
+        for name in ("a", "b", "c"):
+            respx.get(f"{BASE_URL}/applications/{name}").mock(
+                return_value=httpx.Response(200, json={"metadata": {"name": name}})
+            )
+
+        async with ArgocdClient(instance) as client:
+            apps = await client.get_applications_bulk(["c", "a", "b"])
+
+        assert [app.name for app in apps] == ["c", "a", "b"]
+
+    @respx.mock
+    async def test_bounds_in_flight_requests(self, instance: ArgocdInstance):
+        """Test no more than `concurrency` fetches run at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"metadata": {"name": request.url.path}})
+
+        respx.get(url__regex=rf"{BASE_URL}/applications/app-\d+").mock(side_effect=slow)
+
+        async with ArgocdClient(instance) as client:
+            apps = await client.get_applications_bulk(
+                [f"app-{i}" for i in range(10)], concurrency=3
+            )
+
+        assert len(apps) == 10
+        assert peak == 3
+
+    @respx.mock
+    async def test_propagates_api_error(self, instance: ArgocdInstance):
+        """Test an error on any fetch is raised to the caller."""
+        respx.get(f"{BASE_URL}/applications/ok").mock(
+            return_value=httpx.Response(200, json={"metadata": {"name": "ok"}})
+        )
+        respx.get(f"{BASE_URL}/applications/missing").mock(
+            return_value=httpx.Response(404, json={"message": "not found"})
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError):
+                await client.get_applications_bulk(["ok", "missing"])
+
+    async def test_first_error_cancels_remaining_fetches(self, instance: ArgocdInstance):
+        """Test the first error cancels in-flight fetches and never starts queued ones."""
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        async def fake_get_application(name: str) -> Application:
+            started.append(name)
+            if name == "missing":
+                await asyncio.sleep(0)
+                raise ArgocdError(404, "not found")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            raise AssertionError("unreachable")
+
+        async with ArgocdClient(instance) as client:
+            with (
+                patch.object(client, "get_application", side_effect=fake_get_application),
+                pytest.raises(ArgocdError) as exc_info,
+            ):
+                await client.get_applications_bulk(
+                    ["slow", "missing", "q1", "q2", "q3"], concurrency=2
+                )
+
+        assert exc_info.value.code == 404
+        # The slot freed by the failure may admit one queued fetch before the
+        # cancellation lands; it is cancelled too and nothing after it starts.
+        assert "q2" not in started
+        assert "q3" not in started
+        assert sorted(cancelled) == sorted(set(started) - {"missing"})
+
+    @respx.mock
+    async def test_resource_trees_bulk_in_requested_order(self, instance: ArgocdInstance):
+        """Test get_resource_trees_bulk returns one tree per name, in order."""
+        for name in ("a", "b"):
+            respx.get(f"{BASE_URL}/applications/{name}/resource-tree").mock(
+                return_value=httpx.Response(200, json={"nodes": [{"name": f"{name}-pod"}]})
+            )
+
+        async with ArgocdClient(instance) as client:
+            trees = await client.get_resource_trees_bulk(["b", "a"])
+
+        assert trees == [{"nodes": [{"name": "b-pod"}]}, {"nodes": [{"name": "a-pod"}]}]
+
 
 @pytest.mark.unit
 class TestArgocdClientGetApplicationDiff:
@@ -753,6 +1405,28 @@ class TestArgocdClientGetApplicationHistory:
         # Should return the most recent (last 5)
         assert history[0]["id"] == 15
 
+    @respx.mock
+    async def test_get_application_history_masks_returned_entries(self, instance: ArgocdInstance):
+        """Test secrets inside returned history entries are still masked."""
+        respx.get(f"{BASE_URL}/applications/my-app").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "metadata": {"name": "my-app"},
+                    "spec": {},
+                    "status": {
+                        "resources": [{"name": "big", "kind": "ConfigMap"}] * 50,
+                        "history": [{"id": 1, "source": {"password": "hunter22"}}],
+                    },
+                },
+            )
+        )
+
+        async with ArgocdClient(instance) as client:
+            history = await client.get_application_history("my-app")
+
+        assert history == [{"id": 1, "source": {"password": "***MASKED***"}}]
+
     @respx.mock
     async def test_get_application_history_empty(self, instance: ArgocdInstance):
         """Test get_application_history with no history."""
@@ -937,6 +1611,89 @@ class TestArgocdClientGetLogs:
 
         assert logs == ""
 
+    @respx.mock
+    async def test_get_logs_joins_streamed_lines(self, instance: ArgocdInstance):
+        """Test get_logs joins newline-delimited result entries and masks them."""
+        body = (
+            b'{"result": {"content": "starting", "podName": "web"}}\n'
+            b'{"result": {"content": "password=hunter22", "podName": "web"}}\n'
+            b"\n"
+            b'{"result": {"content": "ready", "podName": "web"}}\n'
+        )
+        respx.get(f"{BASE_URL}/applications/my-app/logs").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        async with ArgocdClient(instance) as client:
+            logs = await client.get_logs("my-app")
+
+        assert logs == "starting\npassword=***MASKED***\nready"
+
+    @respx.mock
+    async def test_get_logs_error_raises(self, instance: ArgocdInstance):
+        """Test get_logs surfaces an error status as ArgocdError."""
+        respx.get(f"{BASE_URL}/applications/my-app/logs").mock(
+            return_value=httpx.Response(404, json={"message": "pod not found"})
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError) as exc_info:
+                await client.get_logs("my-app")
+
+        assert exc_info.value.code == 404
+        assert exc_info.value.message == "pod not found"
+
+    @respx.mock
+    async def test_get_logs_stream_error_line_raises(self, instance: ArgocdInstance):
+        """Test an {"error": ...} line sent after the 200 header raises ArgocdError."""
+        body = (
+            b'{"result": {"content": "starting", "podName": "web"}}\n'
+            b'{"error": {"grpc_code": 5, "http_code": 404, "message": "pods \\"web\\" not found",'
+            b' "http_status": "Not Found"}}\n'
+        )
+        respx.get(f"{BASE_URL}/applications/my-app/logs").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError) as exc_info:
+                await client.get_logs("my-app")
+
+        assert exc_info.value.code == 404
+        assert exc_info.value.message == 'pods "web" not found'
+        assert exc_info.value.details == "Not Found"
+
+    @respx.mock
+    async def test_get_logs_stream_error_line_without_http_code(self, instance: ArgocdInstance):
+        """Test an error line without an HTTP code is raised as a 502."""
+        respx.get(f"{BASE_URL}/applications/my-app/logs").mock(
+            return_value=httpx.Response(
+                200, content=b'{"error": {"code": 13, "message": "stream reset"}}\n'
+            )
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError) as exc_info:
+                await client.get_logs("my-app")
+
+        assert exc_info.value.code == 502
+        assert exc_info.value.message == "stream reset"
+
+    @respx.mock
+    async def test_get_logs_undecodable_line_raises(self, instance: ArgocdInstance):
+        """Test a line that is not valid JSON raises ArgocdError instead of a decode error."""
+        body = b'{"result": {"content": "starting"}}\n<html>gateway timeout</html>\n'
+        respx.get(f"{BASE_URL}/applications/my-app/logs").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        async with ArgocdClient(instance) as client:
+            with pytest.raises(ArgocdError) as exc_info:
+                await client.get_logs("my-app")
+
+        assert exc_info.value.code == 502
+        assert exc_info.value.details == "<html>gateway timeout</html>"
+
 
 @pytest.mark.unit
 class TestArgocdClientSyncApplication:
@@ -1188,6 +1945,21 @@ class TestArgocdClientListClusters:
 
         assert clusters == []
 
+    @respx.mock
+    async def test_list_clusters_masks_each_item(self, instance: ArgocdInstance):
+        """Test credentials inside listed clusters are masked."""
+        respx.get(f"{BASE_URL}/clusters").mock(
+            return_value=httpx.Response(
+                200,
+                json={"items": [{"name": "prod", "config": {"bearerToken": "abc"}}]},
+            )
+        )
+
+        async with ArgocdClient(instance) as client:
+            clusters = await client.list_clusters()
+
+        assert clusters == [{"name": "prod", "config": {"bearerToken": "***MASKED***"}}]
+
 
 @pytest.mark.unit
 class TestArgocdClientListProjects:
@@ -1241,3 +2013,34 @@ class TestArgocdClientGetSettings:
             settings = await client.get_settings()
 
         assert settings["appLabelKey"] == "app.kubernetes.io/instance"
+
+    @respx.mock
+    async def test_get_settings_revalidates_with_etag(self, instance: ArgocdInstance):
+        """Test a repeat GET sends If-None-Match and a 304 reuses the previous body."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            side_effect=[
+                httpx.Response(200, json={"url": "https://argocd.io"}, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        async with ArgocdClient(instance) as client:
+            first = await client.get_settings()
+            second = await client.get_settings()
+
+        assert second == first == {"url": "https://argocd.io"}
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @respx.mock
+    async def test_get_settings_without_etag_is_not_conditional(self, instance: ArgocdInstance):
+        """Test responses without an ETag are never revalidated."""
+        route = respx.get(f"{BASE_URL}/settings").mock(
+            return_value=httpx.Response(200, json={"url": "https://argocd.io"})
+        )
+
+        async with ArgocdClient(instance) as client:
+            await client.get_settings()
+            await client.get_settings()
+
+        assert "If-None-Match" not in route.calls[1].request.headers
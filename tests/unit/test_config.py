@@ -181,3 +181,18 @@ class TestServerSettings:
         """Test default server name."""
         settings = ServerSettings()
         assert settings.server_name == "argocd-mcp"
+
+    def test_http_pool_defaults(self):
+        """Test connection pool defaults match the client's built-in limits."""
+        settings = ServerSettings()
+        assert settings.http_max_connections == 100
+        assert settings.http_max_keepalive_connections == 20
+        assert settings.http_keepalive_expiry == 60.0
+
+    def test_http_pool_env_binding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test pool sizing binds from ARGOCD_MCP_HTTP_* variables."""
+        monkeypatch.setenv("ARGOCD_MCP_HTTP_MAX_CONNECTIONS", "10")
+        monkeypatch.setenv("ARGOCD_MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS", "5")
+        settings = ServerSettings()
+        assert settings.http_max_connections == 10
+        assert settings.http_max_keepalive_connections == 5
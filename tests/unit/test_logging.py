@@ -2,13 +2,20 @@
 # ABOUTME: Tests correlation IDs, configure_logging, and AuditLogger class
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import structlog
 
+import argocd_mcp.utils.logging as logging_module
 from argocd_mcp.utils.logging import (
+    AUDIT_LINE_MAX_BYTES,
+    AUDIT_SYNC_ENTRIES,
+    AUDIT_SYNC_INTERVAL,
     AuditLogger,
+    _encode_audit_entry,
     add_correlation_id,
     configure_logging,
     correlation_id,
@@ -150,6 +157,39 @@ class TestConfigureLogging:
             mock_structlog.processors.JSONRenderer.assert_called_once()
             mock_structlog.configure.assert_called_once()
 
+    def test_configure_logging_json_output_with_orjson_writes_bytes(self):
+        """Test JSON output renders with orjson to a bytes logger when it is available."""
+        fake_dumps = MagicMock(return_value=b"{}")
+        with (
+            patch("argocd_mcp.utils.logging.structlog") as mock_structlog,
+            patch("argocd_mcp.utils.logging._orjson_dumps", fake_dumps),
+        ):
+            configure_logging(json_output=True)
+
+            mock_structlog.processors.JSONRenderer.assert_called_once_with(
+                serializer=fake_dumps, option=logging_module._orjson_options
+            )
+            call_kwargs = mock_structlog.configure.call_args[1]
+            assert call_kwargs["logger_factory"] is mock_structlog.BytesLoggerFactory.return_value
+
+    def test_configure_logging_json_output_with_real_orjson(self, capsysbinary):
+        """Test JSON log lines rendered by the installed orjson are valid JSON."""
+        orjson = pytest.importorskip("orjson")
+        try:
+            with (
+                patch("argocd_mcp.utils.logging._orjson_dumps", orjson.dumps),
+                patch("argocd_mcp.utils.logging._orjson_options", orjson.OPT_NON_STR_KEYS),
+            ):
+                configure_logging(json_output=True)
+            structlog.get_logger("test").info("hello", count=3, codes={404: "missing"})
+        finally:
+            structlog.reset_defaults()
+
+        entry = json.loads(capsysbinary.readouterr().out)
+        assert entry["event"] == "hello"
+        assert entry["count"] == 3
+        assert entry["codes"] == {"404": "missing"}
+
     def test_configure_logging_console_output(self):
         """Test configure_logging with console output (default)."""
         with patch("argocd_mcp.utils.logging.structlog") as mock_structlog:
@@ -258,6 +298,84 @@ class TestAuditLoggerLog:
         assert entry["correlation_id"] == "file1234"
         assert "timestamp" in entry
 
+    def test_log_to_file_uses_compact_separators(self, tmp_path: Path):
+        """Test file entries are written without separator whitespace."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+        set_correlation_id("abcd1234")
+
+        logger.log("act", "tgt", "success", {"k": "v"})
+
+        line = log_file.read_text()
+        assert line.endswith('"result":"success","details":{"k":"v"}}\n')
+
+    def test_log_to_file_uses_orjson_when_available(self, tmp_path: Path):
+        """Test file entries are serialized by orjson.dumps when orjson is installed."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+        fake_dumps = MagicMock(return_value=b'{"action":"act"}')
+
+        with patch("argocd_mcp.utils.logging._orjson_dumps", fake_dumps):
+            logger.log("act", "tgt", "success")
+
+        assert fake_dumps.call_args.kwargs["default"] is str
+        assert log_file.read_text() == '{"action":"act"}\n'
+
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    def test_log_to_file_with_each_json_backend(self, tmp_path: Path, backend: str):
+        """Test entries written with orjson and with the stdlib encoder read back the same."""
+        dumps = pytest.importorskip("orjson").dumps if backend == "orjson" else None
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        with patch("argocd_mcp.utils.logging._orjson_dumps", dumps):
+            logger.log("act", "tgt", "error", {"app": "ü", "error": ValueError("boom")})
+
+        entry = json.loads(log_file.read_text())
+        assert entry["details"] == {"app": "ü", "error": "boom"}
+
+    def test_orjson_and_stdlib_encoders_agree(self):
+        """Test both audit encoders produce the same JSON, including non-str dict keys."""
+        orjson = pytest.importorskip("orjson")
+        entry = {
+            "action": "sync",
+            "details": {1: "one", 2.5: "half", None: "none", "app": "ü"},
+            "error": ValueError("boom"),
+        }
+
+        with patch("argocd_mcp.utils.logging._orjson_dumps", None):
+            stdlib = _encode_audit_entry(entry)
+        with (
+            patch("argocd_mcp.utils.logging._orjson_dumps", orjson.dumps),
+            patch("argocd_mcp.utils.logging._orjson_options", orjson.OPT_NON_STR_KEYS),
+        ):
+            fast = _encode_audit_entry(entry)
+
+        assert json.loads(fast) == json.loads(stdlib)
+        assert json.loads(fast)["details"]["1"] == "one"
+
+    def test_log_to_file_stringifies_unserializable_details(self, tmp_path: Path):
+        """Test details values JSON cannot encode are written as their str()."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        logger.log("act", "tgt", "error", {"error": ValueError("boom")})
+
+        entry = json.loads(log_file.read_text())
+        assert entry["details"] == {"error": "boom"}
+
+    def test_log_to_file_truncates_oversized_details(self, tmp_path: Path):
+        """Test an entry over AUDIT_LINE_MAX_BYTES keeps its fields but drops details."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        logger.log("act", "tgt", "error", {"error": "x" * AUDIT_LINE_MAX_BYTES})
+
+        entry = json.loads(log_file.read_text())
+        assert entry["action"] == "act"
+        assert entry["details"]["truncated"] is True
+        assert entry["details"]["size"] > AUDIT_LINE_MAX_BYTES
+
     def test_log_to_file_with_details(self, tmp_path: Path):
         """Test logging to a file with additional details."""
         log_file = tmp_path / "audit.log"
@@ -310,6 +428,117 @@ class TestAuditLoggerLog:
         assert entry1["action"] == "action1"
         assert entry2["action"] == "action2"
 
+    async def test_log_inside_event_loop_uses_writer_thread(self, tmp_path: Path):
+        """File writes from a running event loop are queued and flushed by close()."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        logger.log("action1", "target1", "success")
+        logger.log("action2", "target2", "success")
+        assert logger._writer is not None
+
+        logger.close()
+
+        lines = log_file.read_text().strip().split("\n")
+        assert [json.loads(line)["action"] for line in lines] == ["action1", "action2"]
+        assert logger._writer is None
+
+    async def test_log_inside_event_loop_batches_pending_entries(self, tmp_path: Path):
+        """Entries logged while a drain is queued share that drain's single write."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+        writer = MagicMock()
+        logger._writer = writer
+
+        for i in range(3):
+            logger.log(f"action{i}", "target", "success")
+
+        writer.submit.assert_called_once_with(logger._drain_in_background)
+        assert not log_file.exists()
+
+        logger._writer = None
+        logger.close()
+
+        lines = log_file.read_text().strip().split("\n")
+        assert [json.loads(line)["action"] for line in lines] == ["action0", "action1", "action2"]
+
+    async def test_failed_background_write_is_logged_and_kept(self, tmp_path: Path, capsys):
+        """A write failing in the writer thread is logged and its entries go to stderr."""
+        logger = AuditLogger(log_path=tmp_path / "missing" / "audit.log")
+
+        with patch.object(logger, "_logger") as mock_logger:
+            logger.log("delete_application", "my-app", "success")
+            logger.close()
+
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.kwargs["entries"] == 1
+        entry = json.loads(capsys.readouterr().err)
+        assert entry["action"] == "delete_application"
+        assert logger._batch == []
+
+    def test_failed_inline_write_raises_and_keeps_entries(self, tmp_path: Path):
+        """Outside an event loop a failed write raises and the entry stays queued."""
+        log_file = tmp_path / "missing" / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        with pytest.raises(FileNotFoundError):
+            logger.log("delete_application", "my-app", "success")
+
+        log_file.parent.mkdir()
+        logger.close()
+        assert json.loads(log_file.read_text())["action"] == "delete_application"
+
+    def test_drain_defers_sync_until_close(self, tmp_path: Path):
+        """Batches inside the sync interval are written unsynced; close() syncs them once."""
+        log_file = tmp_path / "audit.log"
+        logger = AuditLogger(log_path=log_file)
+
+        with patch("argocd_mcp.utils.logging._datasync") as datasync:
+            for i in range(3):
+                logger._batch = [f'{{"a":{i}}}\n'.encode()]
+                logger._drain()
+            datasync.assert_not_called()
+
+            logger.close()
+
+        datasync.assert_called_once()
+        assert log_file.read_text() == '{"a":0}\n{"a":1}\n{"a":2}\n'
+
+    def test_drain_syncs_after_interval(self, tmp_path: Path):
+        """A batch written once the sync interval has elapsed is synced with it."""
+        logger = AuditLogger(log_path=tmp_path / "audit.log")
+        logger._last_sync -= AUDIT_SYNC_INTERVAL
+        logger._batch = [b'{"a":1}\n']
+
+        with patch("argocd_mcp.utils.logging._datasync") as datasync:
+            logger._drain()
+            logger.close()
+
+        datasync.assert_called_once()
+        assert logger._unsynced == 0
+
+    def test_drain_syncs_after_entry_count(self, tmp_path: Path):
+        """Reaching AUDIT_SYNC_ENTRIES unsynced entries forces a sync inside the interval."""
+        logger = AuditLogger(log_path=tmp_path / "audit.log")
+
+        with patch("argocd_mcp.utils.logging._datasync") as datasync:
+            logger._batch = [b'{"a":1}\n'] * (AUDIT_SYNC_ENTRIES - 1)
+            logger._drain()
+            datasync.assert_not_called()
+            logger._batch = [b'{"a":2}\n']
+            logger._drain()
+
+        datasync.assert_called_once()
+        assert logger._unsynced == 0
+
+    def test_close_without_writes_is_noop(self, tmp_path: Path):
+        """close() is safe when no background write was ever queued."""
+        logger = AuditLogger(log_path=tmp_path / "audit.log")
+
+        logger.close()
+
+        assert not (tmp_path / "audit.log").exists()
+
     def test_log_to_stdout(self):
         """Test logging to stdout when no log path specified."""
         logger = AuditLogger(log_path=None)
@@ -351,6 +580,20 @@ class TestAuditLoggerLog:
                 details=None,
             )
 
+    def test_log_to_stdout_skips_file_entry(self):
+        """Test stdout logging does not build the file entry."""
+        logger = AuditLogger(log_path=None)
+
+        with (
+            patch.object(logger, "_logger"),
+            patch.object(logger, "_timestamp") as mock_timestamp,
+            patch.object(logger, "_encode") as mock_encode,
+        ):
+            logger.log(action="test_action", target="test_target", result="success")
+
+        mock_timestamp.assert_not_called()
+        mock_encode.assert_not_called()
+
 
 @pytest.mark.unit
 class TestAuditLoggerLogRead:
@@ -522,6 +765,17 @@ class TestAuditLoggerTimestamp:
         # Should end with UTC timezone indicator
         assert timestamp.endswith("+00:00") or timestamp.endswith("Z")
 
+    def test_timestamp_matches_datetime_isoformat(self):
+        """Test the cached-prefix timestamp equals datetime's microsecond ISO form."""
+        logger = AuditLogger()
+
+        with patch("argocd_mcp.utils.logging.time.time_ns", return_value=1_700_000_000_000_123_456):
+            first = logger._timestamp()
+            second = logger._timestamp()
+
+        expected = datetime(2023, 11, 14, 22, 13, 20, 123, tzinfo=UTC).isoformat()
+        assert first == second == expected
+
 
 @pytest.mark.unit
 class TestAuditLoggerIntegration:
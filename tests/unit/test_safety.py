@@ -1,6 +1,9 @@
 # ABOUTME: Unit tests for safety utilities
 # ABOUTME: Tests confirmation patterns, rate limiting, and operation guards
 
+from dataclasses import FrozenInstanceError
+from unittest.mock import patch
+
 import pytest
 
 from argocd_mcp.config import SecuritySettings
@@ -63,6 +66,38 @@ class TestRateLimiter:
         assert limiter.check("key1") is True
         assert limiter.check("key2") is True
 
+    def test_expired_calls_leave_the_window(self):
+        """Test calls older than the window no longer count against the limit."""
+        limiter = RateLimiter(max_calls=2, window_seconds=60)
+
+        with patch("argocd_mcp.utils.safety.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            assert limiter.check("key") is True
+            clock.return_value = 1030.0
+            assert limiter.check("key") is True
+            assert limiter.check("key") is False
+
+            clock.return_value = 1060.0
+            assert limiter.check("key") is True
+            assert limiter.check("key") is False
+
+    def test_window_holds_at_most_max_calls(self):
+        """Test each key retains only its last max_calls timestamps."""
+        limiter = RateLimiter(max_calls=3, window_seconds=1)
+
+        with patch("argocd_mcp.utils.safety.time.monotonic") as clock:
+            for second in range(10):
+                clock.return_value = float(second * 2)
+                assert limiter.check("key") is True
+
+        assert list(limiter._calls["key"]) == [14.0, 16.0, 18.0]
+
+    def test_zero_max_calls_blocks_everything(self):
+        """Test a limit of zero rejects every call."""
+        limiter = RateLimiter(max_calls=0, window_seconds=60)
+
+        assert limiter.check("key") is False
+
 
 @pytest.mark.unit
 class TestSafetyGuard:
@@ -83,6 +118,16 @@ class TestSafetyGuard:
         assert isinstance(result, OperationBlocked)
         assert "Rate limit" in result.reason
 
+    def test_read_and_write_limits_are_independent(self):
+        """Test reads and writes of the same operation name use separate budgets."""
+        settings = SecuritySettings(read_only=False, rate_limit_calls=1, rate_limit_window=60)
+        guard = SafetyGuard(settings)
+
+        assert guard.check_read_operation("op") is None
+        assert guard.check_write_operation("op") is None
+        assert isinstance(guard.check_read_operation("op"), OperationBlocked)
+        assert isinstance(guard.check_write_operation("op"), OperationBlocked)
+
     def test_write_operation_blocked_read_only(self, read_only_safety_guard: SafetyGuard):
         """Test that write operations are blocked in read-only mode."""
         result = read_only_safety_guard.check_write_operation("sync_application")
@@ -237,6 +282,29 @@ class TestOperationBlocked:
         assert "sync_application" in message
         assert "MCP_READ_ONLY" in message
 
+    def test_format_message_reused_for_same_fields(self):
+        """Test blocks with the same fields share one rendered message."""
+        first = OperationBlocked(operation="sync", reason="read-only", setting="MCP_READ_ONLY")
+        second = OperationBlocked(operation="sync", reason="read-only", setting="MCP_READ_ONLY")
+
+        assert first.format_message() is second.format_message()
+        assert first.format_message().endswith(
+            "To enable: Set MCP_READ_ONLY=false in server configuration"
+        )
+
+    def test_is_immutable(self):
+        """Test blocked responses cannot be mutated after construction."""
+        blocked = OperationBlocked(operation="sync", reason="read-only", setting="MCP_READ_ONLY")
+
+        with pytest.raises(FrozenInstanceError):
+            blocked.reason = "other"  # type: ignore[misc]
+
+    def test_has_no_instance_dict(self):
+        """Test blocked responses use slots instead of a per-instance dict."""
+        blocked = OperationBlocked(operation="sync", reason="read-only", setting="MCP_READ_ONLY")
+
+        assert not hasattr(blocked, "__dict__")
+
 
 @pytest.mark.unit
 class TestConfirmationRequired:
@@ -270,3 +338,40 @@ class TestConfirmationRequired:
         message = confirmation.format_message()
         assert "namespace: production" in message
         assert "resources: 5" in message
+
+    def test_format_message_layout(self):
+        """Test the exact layout agents receive, with and without details."""
+        confirmation = ConfirmationRequired(
+            operation="delete_application",
+            target="my-app",
+            impact="Permanent deletion",
+            confirmation_instructions="Set confirm=true",
+        )
+
+        assert confirmation.format_message() == (
+            "CONFIRMATION REQUIRED: delete_application\n\n"
+            "Target: my-app\n"
+            "Impact: Permanent deletion\n\n"
+            "Set confirm=true"
+        )
+
+        confirmation.details = {"namespace": "production"}
+        assert confirmation.format_message() == (
+            "CONFIRMATION REQUIRED: delete_application\n\n"
+            "Target: my-app\n"
+            "Impact: Permanent deletion\n\n"
+            "Details:\n"
+            "  namespace: production\n\n"
+            "Set confirm=true"
+        )
+
+    def test_has_no_instance_dict(self):
+        """Test confirmation responses use slots instead of a per-instance dict."""
+        confirmation = ConfirmationRequired(
+            operation="delete_application",
+            target="my-app",
+            impact="Permanent deletion",
+            confirmation_instructions="Set confirm=true",
+        )
+
+        assert not hasattr(confirmation, "__dict__")
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -969,6 +970,75 @@ class TestDiagnoseSyncFailureTool:
 
         assert "ArgoCD API error" in result
 
+    @pytest.mark.asyncio
+    async def test_diagnose_fetches_concurrently(
+        self,
+        server_with_mocks: dict[str, Any],
+        sample_application: Application,
+    ):
+        """Test the application, resource tree and events are fetched concurrently."""
+        from argocd_mcp.server import DiagnoseSyncFailureParams, diagnose_sync_failure
+
+        mocks = server_with_mocks
+        in_flight = 0
+        peak = 0
+
+        def tracked(value: Any) -> Any:
+            async def fetch(*args: Any, **kwargs: Any) -> Any:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return value
+
+            return fetch
+
+        mocks["client"].get_application.side_effect = tracked(sample_application)
+        mocks["client"].get_resource_tree.side_effect = tracked({"nodes": []})
+        mocks["client"].get_application_events.side_effect = tracked([])
+
+        params = DiagnoseSyncFailureParams(name="test-app", instance="primary")
+        result = await diagnose_sync_failure(params, mocks["ctx"])
+
+        assert "No issues detected" in result
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_diagnose_first_error_cancels_other_lookups(
+        self,
+        server_with_mocks: dict[str, Any],
+    ):
+        """Test a failing lookup cancels the others and its error is returned."""
+        from argocd_mcp.server import DiagnoseSyncFailureParams, diagnose_sync_failure
+
+        mocks = server_with_mocks
+        cancelled: list[str] = []
+
+        def pending(name: str) -> Any:
+            async def fetch(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+
+            return fetch
+
+        async def missing(*args: Any, **kwargs: Any) -> Any:
+            await asyncio.sleep(0)
+            raise ArgocdError(code=404, message="Application not found")
+
+        mocks["client"].get_application.side_effect = missing
+        mocks["client"].get_resource_tree.side_effect = pending("tree")
+        mocks["client"].get_application_events.side_effect = pending("events")
+
+        params = DiagnoseSyncFailureParams(name="nonexistent", instance="primary")
+        result = await diagnose_sync_failure(params, mocks["ctx"])
+
+        assert "Application not found" in result
+        assert sorted(cancelled) == ["events", "tree"]
+
 
 @pytest.mark.unit
 class TestListClustersTool:
@@ -1147,6 +1217,32 @@ class TestSyncApplicationTool:
         assert "Revision: main" in result
         assert "get_application_status" in result
 
+    @pytest.mark.asyncio
+    async def test_sync_application_does_not_wait_on_initial_progress(
+        self,
+        server_with_mocks: dict[str, Any],
+    ):
+        """The opening progress notification must not block the sync request."""
+        from argocd_mcp.server import SyncApplicationParams, sync_application
+
+        mocks = server_with_mocks
+        mocks["client"].sync_application.return_value = {"status": "ok"}
+        release = asyncio.Event()
+
+        async def slow_progress(progress: float, *_args: Any) -> None:
+            if progress == 0:
+                await release.wait()
+
+        mocks["ctx"].report_progress = AsyncMock(side_effect=slow_progress)
+
+        params = SyncApplicationParams(name="test-app", dry_run=False, instance="primary")
+        result = await asyncio.wait_for(sync_application(params, mocks["ctx"]), timeout=1)
+
+        assert "Sync initiated" in result
+        mocks["client"].sync_application.assert_called_once()
+        release.set()
+        await asyncio.sleep(0)
+
     @pytest.mark.asyncio
     async def test_sync_application_blocked_read_only(
         self,
@@ -1178,6 +1274,17 @@ class TestSyncApplicationTool:
                 {"name": "test-app", "dry_run": False, "prune": True}
             )
 
+    def test_sync_application_params_are_frozen(self):
+        """Validated write params cannot be flipped out of dry-run afterwards."""
+        from pydantic import ValidationError
+
+        from argocd_mcp.server import SyncApplicationParams
+
+        params = SyncApplicationParams(name="test-app")
+
+        with pytest.raises(ValidationError):
+            params.dry_run = False
+
     @pytest.mark.asyncio
     async def test_sync_application_handles_error(
         self,
@@ -2142,6 +2249,56 @@ class TestLifespanAndMain:
 
                 mock_client.__aexit__.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_lifespan_passes_pool_limits_from_settings(
+        self,
+        mock_argocd_instance,
+    ):
+        """Test lifespan sizes each client's connection pool from ServerSettings."""
+        from argocd_mcp import server
+        from argocd_mcp.server import lifespan, mcp
+
+        settings = ServerSettings(
+            http_max_connections=8,
+            http_max_keepalive_connections=4,
+            http_keepalive_expiry=15.0,
+        )
+        with (
+            patch.object(server, "load_settings", return_value=settings),
+            patch.object(ServerSettings, "all_instances", new=[mock_argocd_instance]),
+            patch.object(server, "ArgocdClient") as mock_client_class,
+        ):
+            mock_client_class.return_value = AsyncMock()
+
+            async with lifespan(mcp):
+                limits = mock_client_class.call_args.kwargs["limits"]
+
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 4
+        assert limits.keepalive_expiry == 15.0
+
+    @pytest.mark.asyncio
+    async def test_lifespan_warms_up_each_client(
+        self,
+        mock_argocd_instance,
+    ):
+        """Test lifespan starts a connection warmup for every client."""
+        from argocd_mcp import server
+        from argocd_mcp.server import lifespan, mcp
+
+        with (
+            patch.object(server, "load_settings", return_value=ServerSettings()),
+            patch.object(ServerSettings, "all_instances", new=[mock_argocd_instance]),
+            patch.object(server, "ArgocdClient") as mock_client_class,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with lifespan(mcp):
+                await asyncio.sleep(0)
+
+        mock_client.warmup.assert_awaited_once()
+
     def test_main_runs_server(self):
         """Test main entry point runs the server."""
         from argocd_mcp.server import main